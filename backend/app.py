@@ -43,6 +43,9 @@ from backend.controllers.user_controller import users_bp
 from backend.controllers.task_controller import tasks_bp
 from backend.controllers.lesson_controller import lessons_bp
 
+# Models that declare schema requirements (indexes) applied at startup
+from backend.models.task import Task
+
 # Import Request Tracking Middleware
 # Middleware logs all method calls and database queries for the developer panel
 from backend.utils.request_tracker import register_request_tracking
@@ -180,6 +183,24 @@ print("=" * 60)
 # Check if database exists; if not, create schema and seed data
 # This runs once when the app starts for the first time
 
+def apply_schema_indexes(db_path):
+    """
+    Create any indexes the Models need that an existing database is missing.
+
+    schema.sql only runs when the database is first created. Models list the
+    indexes their queries rely on (e.g., Task.SCHEMA_INDEXES), and this applies
+    them on every startup. CREATE INDEX IF NOT EXISTS makes it a no-op when the
+    index is already there.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        for statement in Task.SCHEMA_INDEXES:
+            conn.execute(statement)
+        conn.commit()
+    finally:
+        conn.close()
+
+
 def init_database():
     """
     Initialize the database if it doesn't exist.
@@ -214,6 +235,8 @@ def init_database():
     if os.path.exists(db_path):
         logger.info(f"Database found: {db_path}")
         print(f"Database found: {db_path}")
+        # Databases created before an index was added to schema.sql won't have it
+        apply_schema_indexes(db_path)
         return
 
     logger.info(f"Database not found. Creating new database...")
@@ -243,9 +243,9 @@ def create():
 
     Dev Panel shows:
     - Task.create() method call with arguments
-    - Task.validate() being called
-    - Foreign key validation queries
-    - INSERT query execution
+    - Task.validate() being called (field checks only - no queries)
+    - ONE INSERT ... SELECT ... WHERE EXISTS ... RETURNING * query - the
+      owner/assignee existence check is part of the INSERT itself
     - __DEBUG__ available in same response (no redirect needed in JSON mode)
 
     ✅ DO: Let Model handle validation - Controller catches errors
@@ -432,11 +432,12 @@ def update(task_id):
         task_id: The task's ID from URL
 
     Dev Panel shows:
-    - Task.update() method call with arguments
-    - Task.validate() being called
-    - Task.get_by_id() checking if task exists
-    - Foreign key validation queries
-    - UPDATE query (if validation passes)
+    - Task.update() method call with arguments (field validation runs inside
+      it without queries, so no separate validate call appears)
+    - ONE UPDATE ... RETURNING * query - its WHERE clause also checks that
+      the owner/assignee exist, so there are no separate lookup queries
+    - No row returned = task (or a user) not found; only then a users query
+      runs to pick the right error message
 
     ✅ DO: Handle both validation errors AND not-found cases
     ✅ DO: Re-load users list when re-rendering form after error
@@ -578,8 +579,8 @@ def delete(task_id):
 
     Dev Panel shows:
     - Task.delete() method call with task_id
-    - Task.get_by_id() checking if task exists
-    - DELETE query execution (if task found)
+    - ONE DELETE query - no SELECT first; its row count tells whether the
+      task existed (0 rows = 404)
     - Boolean return value
     - __DEBUG__ available in same response (no redirect needed in JSON mode)
 
@@ -364,8 +364,8 @@ def update(user_id):
     Dev Panel shows:
     - User.update() method call with arguments
     - User.validate() being called
-    - User.get_by_id() checking if user exists
-    - UPDATE query execution
+    - ONE UPDATE ... RETURNING * query - no SELECT before or after it;
+      no row returned means the user doesn't exist (404)
     - __DEBUG__ available in same response (no redirect needed in JSON mode)
 
     ✅ DO: Handle both validation errors AND not-found cases
@@ -478,8 +478,8 @@ def delete(user_id):
 
     Dev Panel shows:
     - User.delete() method call with user_id
-    - User.get_by_id() checking if user exists
-    - DELETE query execution (if user found)
+    - ONE DELETE query - no SELECT first; its row count tells whether the
+      user existed (0 rows = 404)
     - Boolean return value
     - __DEBUG__ available in same response (no redirect needed in JSON mode)
 
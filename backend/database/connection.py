@@ -14,8 +14,10 @@ Learning Purpose:
 
 import sqlite3
 import os
+import threading
 import time
-from typing import Any, List, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Dict, Optional
 from backend.utils.request_tracker import track_db_query, track_error
 
 
@@ -44,8 +46,44 @@ def get_connection() -> sqlite3.Connection:
     return conn
 
 
+# One reusable connection per thread (Flask may serve requests on several threads)
+# sqlite3 connections are not safe to share across threads, so each thread gets its own
+_thread_local = threading.local()
+
+
+def _get_shared_connection() -> sqlite3.Connection:
+    """
+    Return this thread's reusable connection, opening it on first use.
+
+    Why reuse a connection?
+    - Python's sqlite3 keeps a cache of prepared statements PER CONNECTION
+      (keyed by the exact SQL text, 128 entries by default)
+    - Opening a fresh connection for every query throws that cache away,
+      so SQLite re-parses the same SQL on every call
+    - Reusing the connection means a repeated query is parsed once and
+      then only re-bound with new parameters
+
+    ✅ DO: Keep SQL text identical between calls (e.g., module-level constants)
+           so the statement cache can find it
+    ⚠️ DON'T: Build the same query with different whitespace each time
+
+    Returns:
+        sqlite3.Connection: This thread's connection to DB_PATH
+    """
+    conn = getattr(_thread_local, 'conn', None)
+    # Reopen if DB_PATH changed (e.g., tests point it at a temporary file)
+    if conn is None or _thread_local.path != DB_PATH:
+        if conn is not None:
+            conn.close()
+        conn = get_connection()
+        _thread_local.conn = conn
+        _thread_local.path = DB_PATH
+    return conn
+
+
 def execute_query(query: str, params: tuple = (), fetch_one: bool = False,
-                  fetch_all: bool = False, commit: bool = False) -> Optional[Any]:
+                  fetch_all: bool = False, commit: bool = False,
+                  as_dict: bool = True, return_rowcount: bool = False) -> Optional[Any]:
     """
     Execute a SQL query with error handling and developer panel tracking.
 
@@ -55,11 +93,21 @@ def execute_query(query: str, params: tuple = (), fetch_one: bool = False,
         fetch_one: If True, return single row
         fetch_all: If True, return all rows
         commit: If True, commit changes (for INSERT/UPDATE/DELETE)
+        as_dict: If True (default), convert rows to dicts. If False, return the
+                 raw sqlite3.Row objects (supports positional access and tuple
+                 unpacking, which is cheaper for hot read paths)
+        return_rowcount: If True (with commit), return the number of rows
+                         changed instead of lastrowid (for UPDATE/DELETE)
 
     Returns:
-        - If fetch_one: Single row as dict-like object or None
-        - If fetch_all: List of rows as dict-like objects
+        - If fetch_one: Single row as dict (or sqlite3.Row if as_dict=False) or None
+        - If fetch_all: List of rows as dicts (or sqlite3.Row if as_dict=False)
         - If commit: ID of last inserted row (for INSERT) or None
+          (None when the statement wrote no rows, e.g. INSERT ... SELECT ... WHERE
+          whose condition was false)
+        - If commit with return_rowcount: Number of rows changed (0 if none matched)
+        - If commit together with fetch_one/fetch_all: the rows from a
+          RETURNING clause (fetched before the commit)
         - Otherwise: None
 
     Example:
@@ -76,12 +124,14 @@ def execute_query(query: str, params: tuple = (), fetch_one: bool = False,
     MVC Learning:
     - Models call this function to interact with database
     - Using ? placeholders prevents SQL injection
-    - Connection handling is abstracted from models
+    - Connection handling is abstracted from models (one reused connection per thread)
     - Developer panel tracks all queries for performance analysis
     """
     conn = None
+    cursor = None
     try:
-        conn = get_connection()
+        # Reuse this thread's connection so its prepared statement cache is kept
+        conn = _get_shared_connection()
         cursor = conn.cursor()
 
         # Track query execution time for developer panel
@@ -92,99 +142,235 @@ def execute_query(query: str, params: tuple = (), fetch_one: bool = False,
         result = None
         result_row_count = 0
 
-        if commit:
-            conn.commit()
+        # Inside execute_transaction(), the transaction block commits once at the end
+        in_transaction_block = _transaction_depth() > 0
+
+        if commit and not (fetch_one or fetch_all):
+            if not in_transaction_block:
+                conn.commit()
             # Return the ID of the inserted row (useful for INSERT operations)
-            result = cursor.lastrowid
+            # If no row was written, lastrowid is stale - return None instead
             result_row_count = cursor.rowcount
+            if return_rowcount:
+                result = result_row_count
+            else:
+                result = cursor.lastrowid if result_row_count > 0 else None
         elif fetch_one:
             result_obj = cursor.fetchone()
             # Convert Row object to dict for easier use
-            result = dict(result_obj) if result_obj else None
-            result_row_count = 1 if result else 0
+            if result_obj is None:
+                result = None
+            else:
+                result = dict(result_obj) if as_dict else result_obj
+            result_row_count = 1 if result is not None else 0
         elif fetch_all:
             results = cursor.fetchall()
             # Convert Row objects to dicts
-            result = [dict(row) for row in results]
+            result = [dict(row) for row in results] if as_dict else results
             result_row_count = len(result)
 
+        # Writes with RETURNING (e.g., UPDATE ... RETURNING *) fetch first, then commit
+        if commit and (fetch_one or fetch_all) and not in_transaction_block:
+            conn.commit()
+
         # Track the query for the developer panel
         # Converts tuple params to list for JSON serialization
         track_db_query(
             query=query,
             params=list(params) if params else [],
             result_row_count=result_row_count,
-            duration_ms=round(duration_ms, 2)
+            duration_ms=duration_ms
         )
 
         return result
 
-    except sqlite3.IntegrityError as e:
-        # Handle constraint violations (UNIQUE, FOREIGN KEY, etc.)
-        # These are common user errors that should be handled gracefully
-        error_message = str(e)
-        
-        # Create structured error for tracking
-        structured_error = {
-            'error_type': 'IntegrityError',
-            'message': _parse_integrity_error(error_message),
-            'raw': error_message,
-            'query': query,
-            'params': list(params) if params else []
-        }
-        
-        # Track error for developer panel
-        track_error(
-            error_type='IntegrityError',
-            message=structured_error['message'],
-            raw_error=error_message,
-            query=query,
-            params=list(params) if params else []
-        )
-        
-        # Log to console for debugging
-        print(f"Database IntegrityError: {error_message}")
-        print(f"Query: {query}")
-        print(f"Params: {params}")
-        
-        # Re-raise with structured information attached
-        e.structured_error = structured_error
+    except sqlite3.Error as e:
+        # Track the error for the developer panel and re-raise it
+        _record_db_error(e, query, params)
         raise
-        
+
+    finally:
+        if cursor is not None:
+            cursor.close()
+        # The connection stays open for reuse - just make sure a failed write
+        # doesn't leave a half-finished transaction behind for the next query
+        # (inside execute_transaction(), the transaction block decides instead)
+        if conn is not None and conn.in_transaction and _transaction_depth() == 0:
+            conn.rollback()
+
+
+def _transaction_depth() -> int:
+    """Return how many execute_transaction() blocks this thread is inside."""
+    return getattr(_thread_local, 'transaction_depth', 0)
+
+
+@contextmanager
+def execute_transaction() -> Iterator[sqlite3.Connection]:
+    """
+    Run several queries as ONE database transaction (one commit at the end).
+
+    Usage:
+        with execute_transaction():
+            task_id = execute_query("INSERT INTO tasks ...", params, commit=True)
+            task = execute_query("SELECT * FROM tasks WHERE id = ?", (task_id,),
+                                 fetch_one=True)
+        # Committed here - or rolled back if the block raised an exception
+
+    Why?
+    - Each commit makes SQLite write its journal to disk (an fsync - slow)
+    - One transaction = one commit, however many statements are inside
+    - All-or-nothing: if anything fails, none of the writes are kept
+    - BEGIN IMMEDIATE takes the write lock up front, so data read inside the
+      block (e.g., "does this user exist?") can't change before we write
+
+    Inside the block, execute_query(commit=True) does NOT commit by itself.
+    Nested blocks join the outer transaction; the outermost one commits.
+
+    ✅ DO: Keep transactions short - other writers wait while one is open
+    ⚠️ DON'T: Do slow work (network calls, rendering) inside the block
+
+    Yields:
+        sqlite3.Connection: This thread's shared connection
+    """
+    conn = _get_shared_connection()
+    depth = _transaction_depth()
+
+    # Already inside a transaction: join it, the outer block commits
+    if depth > 0:
+        _thread_local.transaction_depth = depth + 1
+        try:
+            yield conn
+        finally:
+            _thread_local.transaction_depth = depth
+        return
+
+    start_time = time.time()
+    conn.execute("BEGIN IMMEDIATE")
+    track_db_query(query="BEGIN IMMEDIATE", duration_ms=(time.time() - start_time) * 1000)
+
+    _thread_local.transaction_depth = 1
+    try:
+        yield conn
+    except BaseException:
+        _thread_local.transaction_depth = 0
+        conn.rollback()
+        track_db_query(query="ROLLBACK")
+        raise
+    else:
+        _thread_local.transaction_depth = 0
+        start_time = time.time()
+        conn.commit()
+        track_db_query(query="COMMIT", duration_ms=(time.time() - start_time) * 1000)
+
+
+def iter_query(query: str, params: tuple = (), as_dict: bool = True) -> Iterator[Any]:
+    """
+    Run a SELECT and yield its rows one at a time instead of building a list.
+
+    Args:
+        query: SQL query string (use ? for parameters)
+        params: Tuple of parameters to safely substitute into query
+        as_dict: If True (default), yield dicts. If False, yield raw sqlite3.Row objects
+
+    Yields:
+        One row per iteration
+
+    Example:
+        for task in iter_query("SELECT * FROM tasks"):
+            print(task['title'])
+
+    Why stream?
+    - fetch_all=True holds EVERY row in memory at once (memory grows with the table)
+    - Iterating the cursor holds only the current row, so memory stays flat
+    - Best when the caller loops over the rows once (rendering, serializing)
+
+    ✅ DO: Consume the whole iterator (or close it) - the query is recorded in
+           the developer panel once iteration finishes
+    ⚠️ DON'T: Use this for INSERT/UPDATE/DELETE - use execute_query(commit=True)
+    """
+    cursor = None
+    row_count = 0
+    duration_ms = 0.0
+    try:
+        # Same per-thread connection as execute_query (statement cache is shared)
+        cursor = _get_shared_connection().cursor()
+
+        start_time = time.time()
+        cursor.execute(query, params)
+        duration_ms = (time.time() - start_time) * 1000
+
+        # The cursor fetches rows from SQLite lazily as we iterate
+        for row in cursor:
+            row_count += 1
+            yield dict(row) if as_dict else row
+
     except sqlite3.Error as e:
-        # Handle other database errors (connection issues, syntax errors, etc.)
-        error_message = str(e)
-        
-        # Create structured error for tracking
-        structured_error = {
-            'error_type': type(e).__name__,
-            'message': error_message,
-            'raw': error_message,
-            'query': query,
-            'params': list(params) if params else []
-        }
-        
-        # Track error for developer panel
-        track_error(
-            error_type=type(e).__name__,
-            message=error_message,
-            raw_error=error_message,
+        _record_db_error(e, query, params)
+        raise
+
+    else:
+        # Track the query for the developer panel (row count is known only at the end)
+        track_db_query(
             query=query,
-            params=list(params) if params else []
+            params=list(params) if params else [],
+            result_row_count=row_count,
+            duration_ms=duration_ms
         )
-        
-        # Log to console for debugging
-        print(f"Database error ({type(e).__name__}): {error_message}")
-        print(f"Query: {query}")
-        print(f"Params: {params}")
-        
-        # Re-raise with structured information attached
-        e.structured_error = structured_error
-        raise
-        
+
     finally:
-        if conn:
-            conn.close()
+        if cursor is not None:
+            cursor.close()
+
+
+def _record_db_error(e: sqlite3.Error, query: str, params: tuple) -> None:
+    """
+    Track a database error for the developer panel and attach details to it.
+
+    Shared by execute_query() and iter_query(). The caller re-raises the error.
+
+    - IntegrityError (UNIQUE, FOREIGN KEY, etc.): common user errors, so the
+      message is turned into something user-friendly
+    - Other sqlite3 errors (connection issues, syntax errors, etc.): raw message
+
+    Sets e.structured_error so controllers can show a helpful message.
+    """
+    error_message = str(e)
+
+    if isinstance(e, sqlite3.IntegrityError):
+        error_type = 'IntegrityError'
+        message = _parse_integrity_error(error_message)
+    else:
+        error_type = type(e).__name__
+        message = error_message
+
+    # Create structured error for tracking
+    structured_error = {
+        'error_type': error_type,
+        'message': message,
+        'raw': error_message,
+        'query': query,
+        'params': list(params) if params else []
+    }
+
+    # Track error for developer panel
+    track_error(
+        error_type=error_type,
+        message=message,
+        raw_error=error_message,
+        query=query,
+        params=list(params) if params else []
+    )
+
+    # Log to console for debugging
+    if error_type == 'IntegrityError':
+        print(f"Database IntegrityError: {error_message}")
+    else:
+        print(f"Database error ({error_type}): {error_message}")
+    print(f"Query: {query}")
+    print(f"Params: {params}")
+
+    # Attach structured information for the caller's re-raise
+    e.structured_error = structured_error
 
 
 def _parse_integrity_error(error_message: str) -> str:
@@ -109,6 +109,13 @@ CREATE INDEX IF NOT EXISTS idx_tasks_priority ON tasks(priority);
 -- Example query: SELECT * FROM tasks WHERE status = 'todo' AND priority = 'high'
 CREATE INDEX IF NOT EXISTS idx_tasks_status_priority ON tasks(status, priority);
 
+-- Index on created_at (+ id tie-breaker): task lists are ordered newest first
+-- Matches Task.get_all()'s ORDER BY tasks.created_at DESC, tasks.id DESC, so
+-- SQLite walks the index in order instead of sorting every row, and LIMIT
+-- can stop after the first page. Also serves keyset pagination (after=...)
+-- Task.SCHEMA_INDEXES mirrors this so existing databases get it too
+CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at DESC, id DESC);
+
 
 -- ============================================================================
 -- LEARNING NOTES
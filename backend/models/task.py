@@ -22,12 +22,166 @@ Design Notes:
 - Clear separation between validation and database operations
 """
 
-from typing import Dict, List, Optional
+import sys
+from functools import lru_cache
+from typing import Dict, Final, Iterator, List, Optional, Tuple
 from datetime import datetime
-from backend.database.connection import execute_query
+from backend.database.connection import execute_query, execute_transaction, iter_query
+from backend.models.user import User
 from backend.utils.decorators import log_method_call
 
 
+# JOIN queries for eager loading owner/assignee (used with include_relations=True)
+# ✅ DO: Keep hot SQL as module-level constants - the text is built once, and the
+#    identical string lets sqlite3's per-connection statement cache reuse the
+#    already-parsed statement instead of re-parsing it on every call
+# ✅ DO: Use LEFT JOIN for nullable relationships (assignee can be NULL)
+# ✅ DO: List columns explicitly - their ORDER must match Task._row_to_task()
+_TASK_JOIN_SELECT = """
+    SELECT
+        tasks.id, tasks.title, tasks.description, tasks.status, tasks.priority,
+        tasks.owner_id, tasks.assignee_id, tasks.created_at, tasks.updated_at,
+        owner.id, owner.name, owner.email, owner.created_at,
+        assignee.id, assignee.name, assignee.email, assignee.created_at
+    FROM tasks
+    INNER JOIN users as owner ON tasks.owner_id = owner.id
+    LEFT JOIN users as assignee ON tasks.assignee_id = assignee.id
+"""
+
+# Single-task statements, shared by every call
+# sys.intern() guarantees ONE string object per statement (even for the joined
+# _GET_BY_ID_JOIN_SQL), so no call ever builds or copies its SQL text
+_GET_BY_ID_SIMPLE_SQL: Final = sys.intern("SELECT * FROM tasks WHERE id = ?")
+_GET_BY_ID_JOIN_SQL: Final = sys.intern(_TASK_JOIN_SELECT + "    WHERE tasks.id = ?\n")
+_DELETE_SQL: Final = sys.intern("DELETE FROM tasks WHERE id = ?")
+_TASK_EXISTS_SQL: Final = sys.intern("SELECT 1 FROM tasks WHERE id = ?")
+
+# Lightweight list query: only the columns a task list row displays
+# ✅ DO: Select only the fields you need - fewer bytes from SQLite, smaller dicts
+_TASK_SUMMARY_SELECT = """
+    SELECT
+        tasks.id, tasks.title, tasks.status, tasks.priority,
+        owner.name AS owner_name,
+        assignee.name AS assignee_name
+    FROM tasks
+    INNER JOIN users as owner ON tasks.owner_id = owner.id
+    LEFT JOIN users as assignee ON tasks.assignee_id = assignee.id
+"""
+
+
+# Columns get_all() can filter on, in the fixed order their ? placeholders appear
+_FILTER_COLUMNS: Final = ('status', 'priority', 'owner_id', 'assignee_id')
+
+
+def _list_sql(select_sql: str) -> Dict[Tuple[Tuple[str, ...], bool, bool], str]:
+    """
+    Build every variant of a task list query up front (called at import time).
+
+    Task lists are ordered newest first, with tasks.id as a tie-breaker so every
+    task has a fixed position (needed for keyset pagination to be exact).
+    A list query only varies in three ways:
+    - filters: WHERE tasks.status = ? AND ...  - any subset of _FILTER_COLUMNS
+    - keyset:  (tasks.created_at, tasks.id) < (?, ?)  - continue after a task
+      (row value comparison: (a, b) < (x, y) means a < x OR (a = x AND b < y))
+    - paged:   LIMIT ? OFFSET ?
+    That is 16 filter combinations x 4 = 64 shapes - still small enough to
+    build once and keep.
+
+    Returns:
+        {(filter_columns, keyset, paged): full SQL string}
+    """
+    order_by = "    ORDER BY tasks.created_at DESC, tasks.id DESC\n"
+    keyset_condition = "(tasks.created_at, tasks.id) < (?, ?)"
+    # ✅ DO: Use ? placeholders for LIMIT/OFFSET too
+    limit_offset = "    LIMIT ? OFFSET ?\n"
+
+    # Every subset of _FILTER_COLUMNS, each kept in _FILTER_COLUMNS order
+    filter_combinations = [
+        tuple(col for i, col in enumerate(_FILTER_COLUMNS) if mask & (1 << i))
+        for mask in range(1 << len(_FILTER_COLUMNS))
+    ]
+
+    shapes = {}
+    for filters in filter_combinations:
+        for keyset in (False, True):
+            conditions = [f"tasks.{col} = ?" for col in filters]
+            if keyset:
+                conditions.append(keyset_condition)
+            where = f"    WHERE {' AND '.join(conditions)}\n" if conditions else ""
+            for paged in (False, True):
+                shapes[(filters, keyset, paged)] = (select_sql
+                                                    + where
+                                                    + order_by
+                                                    + (limit_offset if paged else ""))
+    return shapes
+
+
+@lru_cache(maxsize=64)
+def _get_by_ids_sql(count: int, include_relations: bool) -> str:
+    """
+    Build the "WHERE id IN (?, ?, ...)" query for `count` IDs (cached).
+
+    Task.get_by_ids() needs one ? per ID, so the SQL depends on how many IDs
+    are passed. Caching per count means a repeated batch size reuses the same
+    string instead of formatting a new one on every call.
+    """
+    placeholders = ', '.join('?' * count)
+    if not include_relations:
+        return f"SELECT * FROM tasks WHERE id IN ({placeholders}) ORDER BY created_at DESC"
+    return (_TASK_JOIN_SELECT
+            + f"    WHERE tasks.id IN ({placeholders})\n"
+            + "    ORDER BY tasks.created_at DESC\n")
+
+
+# Task list queries, fully built once at import time
+# ✅ DO: Specialize fixed-shape SQL ahead of time - each call just looks up a
+#    ready-made (and always identical) string, which also keeps sqlite3's
+#    statement cache hitting
+_TASK_LIST_SQL: Final = _list_sql("SELECT * FROM tasks\n")
+_TASK_JOIN_LIST_SQL: Final = _list_sql(_TASK_JOIN_SELECT)
+_TASK_SUMMARY_LIST_SQL: Final = _list_sql(_TASK_SUMMARY_SELECT)
+
+
+@lru_cache(maxsize=64)
+def _update_sql(fields: Tuple[str, ...]) -> str:
+    """
+    Build the UPDATE statement for one combination of fields (cached).
+
+    Task.update() only SETs the fields it was given. There are just 64 possible
+    combinations of the 6 updatable fields, so each SQL string is built once and
+    reused - and because the text is identical every time, sqlite3's statement
+    cache can reuse the parsed statement too.
+
+    Args:
+        fields: Column names to SET, in Task.UPDATABLE_FIELDS order
+                (only ever called with those trusted names - never user input)
+
+    Returns:
+        "UPDATE tasks SET a = ?, b = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?
+         [AND <owner exists>] [AND <assignee exists or NULL>] RETURNING *"
+
+        Parameters, in order: the SET values, task_id, then owner_id (if in
+        fields), then assignee_id twice (if in fields) - see Task.update()
+
+    ✅ DO: Always update the updated_at timestamp
+    ✅ DO: Fold the foreign key checks into the WHERE clause (like Task.create()),
+           so the usual update is ONE statement - no separate users query
+    ✅ DO: Use RETURNING (SQLite 3.35+) to get the updated row without a follow-up SELECT
+           (no row returned means the task doesn't exist OR a user doesn't exist)
+    """
+    set_clauses = [f"{field} = ?" for field in fields]
+    set_clauses.append("updated_at = CURRENT_TIMESTAMP")
+
+    conditions = ["id = ?"]
+    if 'owner_id' in fields:
+        conditions.append("EXISTS (SELECT 1 FROM users WHERE id = ?)")
+    if 'assignee_id' in fields:
+        conditions.append("(? IS NULL OR EXISTS (SELECT 1 FROM users WHERE id = ?))")
+
+    return (f"UPDATE tasks SET {', '.join(set_clauses)} "
+            f"WHERE {' AND '.join(conditions)} RETURNING *")
+
+
 class Task:
     """
     Task model for managing task data, relationships, and operations.
@@ -48,17 +202,39 @@ class Task:
     ⚠️ DON'T: Fetch tasks in a loop and query users separately (N+1 problem!)
     """
 
-    # Valid status values
+    # Valid status values (in display order, for error messages and dropdowns)
     # ✅ DO: Define enum values as class constants
-    VALID_STATUSES = ['todo', 'in-progress', 'done']
-
-    # Valid priority values
-    VALID_PRIORITIES = ['low', 'medium', 'high']
+    # ✅ DO: Use tuples - immutable, so nothing can accidentally append to them
+    VALID_STATUSES_DISPLAY = ('todo', 'in-progress', 'done')
+
+    # Valid priority values (in display order)
+    VALID_PRIORITIES_DISPLAY = ('low', 'medium', 'high')
+
+    # Sets used for validation checks
+    # ✅ DO: Use frozenset for membership tests - O(1) hash lookup instead of a list scan
+    VALID_STATUSES = frozenset(VALID_STATUSES_DISPLAY)
+    VALID_PRIORITIES = frozenset(VALID_PRIORITIES_DISPLAY)
+
+    # Indexes this model's queries rely on (also defined in schema.sql)
+    # schema.sql only runs when the database is first created, so app startup
+    # applies these to existing databases as well (IF NOT EXISTS = safe to re-run)
+    # ✅ DO: Index the columns you JOIN on and ORDER BY
+    SCHEMA_INDEXES = (
+        # JOINs to users (owner/assignee) become index lookups
+        "CREATE INDEX IF NOT EXISTS idx_tasks_owner_id ON tasks(owner_id)",
+        "CREATE INDEX IF NOT EXISTS idx_tasks_assignee_id ON tasks(assignee_id)",
+        # get_all()'s ORDER BY created_at DESC, id DESC reads the index in order (no sort)
+        "CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON tasks(created_at DESC, id DESC)",
+    )
+
+    # Fields that Task.update() is allowed to change
+    UPDATABLE_FIELDS = ('title', 'description', 'status', 'priority', 'owner_id', 'assignee_id')
 
     @staticmethod
     @log_method_call
     def validate(title: str, description: str, status: str, priority: str,
-                 owner_id: int, assignee_id: Optional[int] = None) -> None:
+                 owner_id: int, assignee_id: Optional[int] = None,
+                 check_users: bool = True) -> None:
         """
         Validate task data before database operations.
 
@@ -76,6 +252,8 @@ class Task:
             priority: Task priority (must be in VALID_PRIORITIES)
             owner_id: ID of user who owns this task (required, must exist)
             assignee_id: ID of user assigned to this task (optional, must exist if provided)
+            check_users: If False, skip the foreign key queries (pure Python checks only).
+                         Task.create() uses this because its INSERT checks the users itself.
 
         Raises:
             ValueError: If validation fails, with descriptive message
@@ -94,35 +272,74 @@ class Task:
 
         Covered in: Lesson 4 (Model validation with relationships)
         """
+        # Check title, status and priority (pure Python, no queries)
+        Task._validate_fields({'title': title, 'status': status, 'priority': priority})
+
+        # Check owner_id (and assignee_id, if provided) exist in users table
+        # ✅ DO: Validate foreign keys to prevent orphaned records
+        # This demonstrates referential integrity at the application level
+        if check_users:
+            Task._check_users_exist(owner_id, assignee_id)
+
+    @staticmethod
+    def _validate_fields(fields: Dict[str, any]) -> None:
+        """
+        Validate only the title/status/priority values present in `fields`.
+
+        Used by validate() (all fields), by update() (just the fields being
+        changed - values already in the database were validated when saved)
+        and by get_all() for its status/priority filters. Other keys are ignored.
+
+        Raises:
+            ValueError: If a supplied field is invalid
+        """
         # Check title is not empty
         # ✅ DO: Check for empty strings, not just None
-        if not title or not title.strip():
-            raise ValueError("Title is required and cannot be empty")
+        if 'title' in fields:
+            title = fields['title']
+            if not title or not title.strip():
+                raise ValueError("Title is required and cannot be empty")
 
         # Check status is valid
         # ✅ DO: Enforce enum constraints in application code AND database
-        if status not in Task.VALID_STATUSES:
-            raise ValueError(f"Status must be one of {Task.VALID_STATUSES}, got: {status}")
+        if 'status' in fields and fields['status'] not in Task.VALID_STATUSES:
+            raise ValueError(f"Status must be one of {list(Task.VALID_STATUSES_DISPLAY)}, got: {fields['status']}")
 
         # Check priority is valid
-        if priority not in Task.VALID_PRIORITIES:
-            raise ValueError(f"Priority must be one of {Task.VALID_PRIORITIES}, got: {priority}")
+        if 'priority' in fields and fields['priority'] not in Task.VALID_PRIORITIES:
+            raise ValueError(f"Priority must be one of {list(Task.VALID_PRIORITIES_DISPLAY)}, got: {fields['priority']}")
 
-        # Check owner_id exists in users table
-        # ✅ DO: Validate foreign keys to prevent orphaned records
-        # This demonstrates referential integrity at the application level
-        owner_query = "SELECT id FROM users WHERE id = ?"
-        owner = execute_query(owner_query, (owner_id,), fetch_one=True)
-        if not owner:
-            raise ValueError(f"Owner user with ID {owner_id} does not exist")
+    @staticmethod
+    def _check_users_exist(owner_id: Optional[int], assignee_id: Optional[int] = None,
+                           check_owner: bool = True) -> None:
+        """
+        Check that the owner (and assignee, if provided) exist in the users table.
 
-        # Check assignee_id exists if provided
+        Args:
+            owner_id: ID of user who owns the task
+            assignee_id: ID of user assigned to the task (None means unassigned)
+            check_owner: If False, only the assignee is checked (partial updates
+                         that don't change the owner)
+
+        Raises:
+            ValueError: If either user does not exist
+        """
+        # ✅ DO: Check both IDs with ONE query (WHERE id IN (...)) instead of one query per ID
+        # ✅ DO: Reuse recent answers - User.existing_ids() caches results per ID tuple
         # ⚠️ IMPORTANT: assignee_id is nullable, so None is valid
+        user_ids = (owner_id,) if check_owner else ()
         if assignee_id is not None:
-            assignee_query = "SELECT id FROM users WHERE id = ?"
-            assignee = execute_query(assignee_query, (assignee_id,), fetch_one=True)
-            if not assignee:
-                raise ValueError(f"Assignee user with ID {assignee_id} does not exist")
+            user_ids += (assignee_id,)
+        if not user_ids:
+            return
+
+        found_ids = User.existing_ids(user_ids)
+
+        if check_owner and owner_id not in found_ids:
+            raise ValueError(f"Owner user with ID {owner_id} does not exist")
+
+        if assignee_id is not None and assignee_id not in found_ids:
+            raise ValueError(f"Assignee user with ID {assignee_id} does not exist")
 
     @staticmethod
     @log_method_call
@@ -134,9 +351,10 @@ class Task:
         MVC Flow:
         1. Controller receives POST request with form data
         2. Controller calls Task.create(...)
-        3. Model validates data (raises error if invalid)
-        4. Model executes INSERT query with timestamps
-        5. Model fetches newly created task and returns dict
+        3. Model validates fields (raises error if invalid)
+        4. Model executes a single INSERT ... SELECT that only inserts if the
+           owner/assignee users exist (foreign key check folded into the INSERT)
+        5. The same INSERT hands back the new row (RETURNING *) - model returns it
         6. Controller receives task dict and decides what to render
 
         Args:
@@ -162,30 +380,48 @@ class Task:
              'owner_id': 1, 'assignee_id': 2, ...}
 
         ✅ DO: Validate before inserting into database
+        ✅ DO: Let the INSERT check foreign keys (one statement instead of SELECT + INSERT)
         ✅ DO: Set created_at and updated_at to current timestamp
         ✅ DO: Return complete task data (including generated ID and timestamps)
+        ✅ DO: Get the stored row back with RETURNING instead of a second SELECT
         ⚠️ DON'T: Return just the ID - Controller needs full data for rendering
 
         Covered in: Lesson 4 (creating tasks with relationships)
         """
-        # Validate input data
+        # Validate input data (title, status, priority - no SQL)
         # This will raise ValueError if invalid - Controller handles the error
-        Task.validate(title, description, status, priority, owner_id, assignee_id)
+        # Foreign keys are checked by the INSERT below, so skip the users query here
+        Task.validate(title, description, status, priority, owner_id, assignee_id,
+                      check_users=False)
 
-        # Insert into database with timestamps
+        # Insert into database with timestamps - but only if the users exist
         # ✅ DO: Use parameterized queries (? placeholders) to prevent SQL injection
+        # ✅ DO: Fold the foreign key check into the INSERT (INSERT ... SELECT ... WHERE EXISTS)
+        #    One statement instead of "SELECT users" + "INSERT task"
         # Note: SQLite's CURRENT_TIMESTAMP is UTC, which is good practice
         query = """
             INSERT INTO tasks (title, description, status, priority, owner_id, assignee_id,
                              created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
+            SELECT ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP
+            WHERE EXISTS (SELECT 1 FROM users WHERE id = ?)
+              AND (? IS NULL OR EXISTS (SELECT 1 FROM users WHERE id = ?))
+            RETURNING *
         """
-        task_id = execute_query(query, (title, description, status, priority,
-                                       owner_id, assignee_id), commit=True)
-
-        # Fetch and return the newly created task
-        # This ensures we return data exactly as stored (with timestamp, etc.)
-        return Task.get_by_id(task_id)
+        # ✅ DO: Let RETURNING * hand back the stored row (generated ID, timestamps)
+        #    One statement instead of "INSERT" + "SELECT the new task" (SQLite 3.35+)
+        new_task = execute_query(query, (title, description, status, priority,
+                                         owner_id, assignee_id,
+                                         owner_id, assignee_id, assignee_id),
+                                 fetch_one=True, commit=True)
+
+        # No row inserted means owner or assignee doesn't exist
+        # Only on this (rare) failure path do we query users to build a precise error message
+        if new_task is None:
+            Task._check_users_exist(owner_id, assignee_id)
+            raise ValueError("Owner or assignee user does not exist")
+
+        # Exactly as stored - same dict get_by_id() would return
+        return new_task
 
     @staticmethod
     @log_method_call
@@ -206,6 +442,7 @@ class Task:
 
         Returns:
             Task dict if found, None if not found
+            (always a plain dict - never a sqlite3.Row - with or without relations)
 
             Without relations (include_relations=False):
             {
@@ -266,67 +503,34 @@ class Task:
         """
         if not include_relations:
             # Simple query without JOINs - just task data
-            query = "SELECT * FROM tasks WHERE id = ?"
+            # execute_query converts the sqlite3.Row to a plain dict (as_dict=True),
+            # so both branches return dicts and callers never see Row objects
+            query = _GET_BY_ID_SIMPLE_SQL
             return execute_query(query, (task_id,), fetch_one=True)
         else:
             # This demonstrates eager loading to avoid N+1 queries!
             # We JOIN with users table to get owner and assignee in ONE query
-            # ✅ DO: Use LEFT JOIN for nullable relationships (assignee can be NULL)
-            # ✅ DO: Alias columns to avoid name collisions (owner_id vs assignee_id)
-            query = """
-                SELECT
-                    tasks.*,
-                    owner.id as owner_user_id,
-                    owner.name as owner_name,
-                    owner.email as owner_email,
-                    owner.created_at as owner_created_at,
-                    assignee.id as assignee_user_id,
-                    assignee.name as assignee_name,
-                    assignee.email as assignee_email,
-                    assignee.created_at as assignee_created_at
-                FROM tasks
-                INNER JOIN users as owner ON tasks.owner_id = owner.id
-                LEFT JOIN users as assignee ON tasks.assignee_id = assignee.id
-                WHERE tasks.id = ?
-            """
-            result = execute_query(query, (task_id,), fetch_one=True)
+            # See _TASK_JOIN_SELECT at the top of this file for the SQL
+            query = _GET_BY_ID_JOIN_SQL
+            # as_dict=False: keep the raw row so _row_to_task can unpack it by position
+            result = execute_query(query, (task_id,), fetch_one=True, as_dict=False)
 
             if not result:
                 return None
 
             # Transform flat result into nested structure
             # This makes it easier to work with in templates and controllers
-            task = {
-                'id': result['id'],
-                'title': result['title'],
-                'description': result['description'],
-                'status': result['status'],
-                'priority': result['priority'],
-                'owner_id': result['owner_id'],
-                'assignee_id': result['assignee_id'],
-                'created_at': result['created_at'],
-                'updated_at': result['updated_at'],
-                'owner': {
-                    'id': result['owner_user_id'],
-                    'name': result['owner_name'],
-                    'email': result['owner_email'],
-                    'created_at': result['owner_created_at']
-                },
-                'assignee': {
-                    'id': result['assignee_user_id'],
-                    'name': result['assignee_name'],
-                    'email': result['assignee_email'],
-                    'created_at': result['assignee_created_at']
-                } if result['assignee_user_id'] is not None else None
-            }
-
-            return task
+            return Task._row_to_task(result)
 
     @staticmethod
     @log_method_call
-    def get_all(include_relations: bool = False) -> List[Dict[str, any]]:
+    def get_all(include_relations: bool = False, limit: Optional[int] = None,
+                offset: int = 0, after: Optional[Dict[str, any]] = None,
+                status: Optional[str] = None, priority: Optional[str] = None,
+                owner_id: Optional[int] = None,
+                assignee_id: Optional[int] = None) -> List[Dict[str, any]]:
         """
-        Fetch all tasks from the database, optionally including related user data.
+        Fetch tasks from the database (newest first), optionally including related user data.
 
         MVC Flow:
         1. Controller needs to show list of all tasks
@@ -337,11 +541,40 @@ class Task:
 
         Args:
             include_relations: If True, include owner and assignee user details via JOINs
+            limit: Maximum number of tasks to return (None = no limit)
+            offset: Number of tasks to skip (page 3 of 20 = offset 40)
+            after: The last task of the previous page (keyset pagination).
+                   Returns only tasks that come after it in the list order.
+            status: Only tasks with this status (None = any status)
+            priority: Only tasks with this priority (None = any priority)
+            owner_id: Only tasks owned by this user (None = any owner)
+            assignee_id: Only tasks assigned to this user (None = any assignee)
 
         Returns:
-            List of task dicts (empty list if no tasks exist)
+            List of task dicts (empty list if no tasks match)
             Format same as get_by_id() - nested owner/assignee if include_relations=True
 
+        Pagination - keep memory bounded as the table grows:
+            page1 = Task.get_all(include_relations=True, limit=20)
+            page2 = Task.get_all(include_relations=True, limit=20, offset=20)   # OFFSET
+            page2 = Task.get_all(include_relations=True, limit=20, after=page1[-1])  # keyset
+
+            OFFSET is simple, but SQLite still walks past every skipped row.
+            Keyset (after=...) jumps straight to the right place, so page 500 is
+            as fast as page 1.
+
+        Filtering - let the database pick the rows:
+            todo = Task.get_all(status='todo')
+            mine = Task.get_all(include_relations=True, assignee_id=2, priority='high')
+
+            Filters become WHERE tasks.status = ? AND ... in the SQL, so only
+            matching rows ever leave SQLite (and indexed columns like owner_id
+            and assignee_id can use their index).
+
+        Raises:
+            ValueError: If status/priority is not a valid value, or limit/offset
+                        is negative
+
         N+1 Query Problem - THIS IS CRITICAL FOR PERFORMANCE:
         ❌ BAD approach (causes N+1 queries):
             tasks = Task.get_all()  # Query 1: Fetch all tasks
@@ -364,68 +597,275 @@ class Task:
 
         ✅ DO: Use include_relations=True when listing tasks with user names
         ✅ DO: Return empty list if no tasks (Controller can iterate safely)
+        ✅ DO: Pass limit (and offset/after) for lists that can grow large
+        ✅ DO: Filter with status=/priority=/owner_id=/assignee_id= here
+        ⚠️ DON'T: Fetch every task and filter the list in Python
         ⚠️ DON'T: Fetch users in a loop after getting tasks - N+1 problem!
 
         Covered in: Lesson 4 (N+1 query problem and eager loading solution)
         """
+        # Materialize the streamed rows into a list (templates and jsonify need a list)
+        return list(Task.iter_all(include_relations, limit=limit, offset=offset, after=after,
+                                  status=status, priority=priority,
+                                  owner_id=owner_id, assignee_id=assignee_id))
+
+    @staticmethod
+    def iter_all(include_relations: bool = False, limit: Optional[int] = None,
+                 offset: int = 0, after: Optional[Dict[str, any]] = None,
+                 status: Optional[str] = None, priority: Optional[str] = None,
+                 owner_id: Optional[int] = None,
+                 assignee_id: Optional[int] = None) -> Iterator[Dict[str, any]]:
+        """
+        Like get_all(), but yields one task at a time instead of returning a list.
+
+        Rows are read from the database cursor as you loop, so only the current
+        task is held in memory - useful for exports or other one-pass loops over
+        a large table. Same arguments and task format as get_all().
+
+        Example:
+            >>> for task in Task.iter_all(include_relations=True):
+            ...     write_csv_row(task)
+
+        Note: Not decorated with @log_method_call - the decorator logs the
+        return value, and a generator has nothing useful to show until it is
+        consumed. get_all() (which uses this) is logged as usual, and the query
+        itself still appears in the Database Inspector.
+
+        ✅ DO: Use this when you loop over the tasks exactly once
+        ⚠️ DON'T: Use it when you need len() or to loop twice - use get_all()
+        """
+        # WHERE (filters, keyset) + ORDER BY + LIMIT/OFFSET, pushed down into SQL
+        filters = {'status': status, 'priority': priority,
+                   'owner_id': owner_id, 'assignee_id': assignee_id}
+        shape, params = Task._page_params(limit, offset, after, filters)
+
         if not include_relations:
             # Simple query without JOINs - just task data
-            query = "SELECT * FROM tasks ORDER BY created_at DESC"
-            result = execute_query(query, fetch_all=True)
-            return result if result else []
+            query = _TASK_LIST_SQL[shape]
+            # Each row arrives as a plain dict (as_dict=True), like the JOIN branch
+            yield from iter_query(query, params)
         else:
             # Eager loading with JOINs - prevents N+1 query problem!
-            # Same JOIN logic as get_by_id, but for all tasks
-            query = """
-                SELECT
-                    tasks.*,
-                    owner.id as owner_user_id,
-                    owner.name as owner_name,
-                    owner.email as owner_email,
-                    owner.created_at as owner_created_at,
-                    assignee.id as assignee_user_id,
-                    assignee.name as assignee_name,
-                    assignee.email as assignee_email,
-                    assignee.created_at as assignee_created_at
-                FROM tasks
-                INNER JOIN users as owner ON tasks.owner_id = owner.id
-                LEFT JOIN users as assignee ON tasks.assignee_id = assignee.id
-                ORDER BY tasks.created_at DESC
-            """
-            results = execute_query(query, fetch_all=True)
-
-            if not results:
-                return []
+            # Same JOIN logic as get_by_id (_TASK_JOIN_SELECT), but for all tasks
+            query = _TASK_JOIN_LIST_SQL[shape]
+
+            # Transform flat results into nested structure, one row at a time
+            # One user_cache for the whole result: each user becomes ONE shared dict
+            user_cache = {}
+            for row in iter_query(query, params, as_dict=False):
+                yield Task._row_to_task(row, user_cache)
+
+    @staticmethod
+    def _page_params(limit: Optional[int], offset: int, after: Optional[Dict[str, any]],
+                     filters: Optional[Dict[str, any]] = None
+                     ) -> Tuple[Tuple[Tuple[str, ...], bool, bool], tuple]:
+        """
+        Work out which task list query shape to use, and its parameters.
+
+        The SQL for every shape is built once at import time (see _list_sql()),
+        so a call only picks a prebuilt string - no string building per request.
+
+        Args:
+            filters: {column: value} for the WHERE filters - None values are
+                     skipped (no filter on that column)
+
+        Returns:
+            ((filter_columns, keyset, paged), params) - use the triple as the
+            key into a _*_LIST_SQL dict, and pass params to the query
+
+        Raises:
+            ValueError: If limit or offset is negative, or a status/priority
+                        filter is not a valid value
+        """
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit must be zero or positive, got: {limit}")
+        if offset < 0:
+            raise ValueError(f"offset must be zero or positive, got: {offset}")
+
+        # Filters: same checks (and messages) as validate(), only for given keys
+        filters = {col: value for col, value in (filters or {}).items() if value is not None}
+        Task._validate_fields(filters)
+
+        # Placeholders appear in _FILTER_COLUMNS order, so bind values in that order
+        filter_columns = tuple(col for col in _FILTER_COLUMNS if col in filters)
+        params = tuple(filters[col] for col in filter_columns)
+
+        # Keyset pagination: continue after the last task of the previous page
+        keyset = after is not None
+        if keyset:
+            params += (after['created_at'], after['id'])
+
+        # SQLite: LIMIT -1 = no limit (used when only offset is given)
+        paged = limit is not None or offset > 0
+        if paged:
+            params += (limit if limit is not None else -1, offset)
+
+        return (filter_columns, keyset, paged), params
+
+    @staticmethod
+    @log_method_call
+    def get_by_ids(task_ids: List[int], include_relations: bool = False) -> List[Dict[str, any]]:
+        """
+        Fetch several tasks by ID in ONE query, optionally including related user data.
+
+        MVC Flow:
+        1. Controller has a list of task IDs to show (e.g., tasks visible to a user)
+        2. Controller calls Task.get_by_ids(ids, include_relations=True)
+        3. Model runs a single query with WHERE tasks.id IN (?, ?, ...)
+        4. Model returns list of task dicts (same format as get_all())
+        5. Controller passes list to View for rendering
+
+        Args:
+            task_ids: List of task IDs to fetch
+            include_relations: If True, include owner and assignee user details via JOINs
+
+        Returns:
+            List of task dicts, newest first (IDs that don't exist are skipped;
+            empty list if task_ids is empty)
+
+        N+1 Query Problem - the "subset of tasks" version:
+        ❌ BAD (N queries):
+            tasks = [Task.get_by_id(task_id, include_relations=True) for task_id in ids]
+
+        ❌ ALSO BAD (loads every task just to keep a few):
+            tasks = [t for t in Task.get_all(include_relations=True) if t['id'] in ids]
+
+        ✅ GOOD (1 query):
+            tasks = Task.get_by_ids(ids, include_relations=True)
+
+        ✅ DO: Use this instead of calling get_by_id() in a loop
+        ⚠️ DON'T: Fetch all tasks and filter them in Python
+
+        Covered in: Lesson 4 (N+1 query problem and eager loading solution)
+        """
+        if not task_ids:
+            return []
+
+        # One ? placeholder per ID - values are still passed as parameters (no SQL injection)
+        params = tuple(task_ids)
+        query = _get_by_ids_sql(len(params), include_relations)
+
+        if not include_relations:
+            # Simple query without JOINs - just task data
+            # List of plain dicts (as_dict=True), like the JOIN branch
+            return execute_query(query, params, fetch_all=True)
+        else:
+            # Same JOIN logic as get_by_id/get_all (_TASK_JOIN_SELECT), filtered by ID list
+            results = execute_query(query, params, fetch_all=True, as_dict=False)
 
             # Transform flat results into nested structure
-            tasks = []
-            for result in results:
-                task = {
-                    'id': result['id'],
-                    'title': result['title'],
-                    'description': result['description'],
-                    'status': result['status'],
-                    'priority': result['priority'],
-                    'owner_id': result['owner_id'],
-                    'assignee_id': result['assignee_id'],
-                    'created_at': result['created_at'],
-                    'updated_at': result['updated_at'],
-                    'owner': {
-                        'id': result['owner_user_id'],
-                        'name': result['owner_name'],
-                        'email': result['owner_email'],
-                        'created_at': result['owner_created_at']
-                    },
-                    'assignee': {
-                        'id': result['assignee_user_id'],
-                        'name': result['assignee_name'],
-                        'email': result['assignee_email'],
-                        'created_at': result['assignee_created_at']
-                    } if result['assignee_user_id'] is not None else None
+            # One user_cache for the whole result: each user becomes ONE shared dict
+            user_cache = {}
+            return [Task._row_to_task(row, user_cache) for row in results]
+
+    @staticmethod
+    @log_method_call
+    def get_all_summary(limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, any]]:
+        """
+        Fetch a lightweight list of tasks - just what a list view row shows.
+
+        MVC Flow:
+        1. Controller needs a compact task list (e.g., a sidebar or dropdown)
+        2. Controller calls Task.get_all_summary()
+        3. Model runs ONE query selecting only id, title, status, priority
+           and the owner/assignee NAMES (JOINs, so still no N+1 problem)
+        4. Controller passes the list to the View
+
+        Args:
+            limit: Maximum number of tasks to return (None = no limit)
+            offset: Number of tasks to skip
+
+        Returns:
+            List of flat dicts, newest first:
+            [{'id': 1, 'title': 'Fix bug', 'status': 'todo', 'priority': 'high',
+              'owner_name': 'Alice', 'assignee_name': 'Bob'}, ...]
+            assignee_name is None for unassigned tasks.
+
+        Compared to get_all(include_relations=True):
+        - No description, timestamps, emails or nested user dicts
+        - Much less data copied out of SQLite and much smaller Python dicts
+        - Use get_all() when the page needs the full task
+
+        ✅ DO: Select only the columns the page actually displays
+        ⚠️ DON'T: Use SELECT * for list views that show three fields
+
+        Covered in: Lesson 4 (JOINs and choosing what to load)
+        """
+        # Same ordering (and LIMIT/OFFSET handling) as get_all()
+        shape, params = Task._page_params(limit, offset, None)
+        query = _TASK_SUMMARY_LIST_SQL[shape]
+        return execute_query(query, params, fetch_all=True)
+
+    @staticmethod
+    def _row_to_task(row, user_cache: Optional[Dict[int, Dict[str, any]]] = None) -> Dict[str, any]:
+        """
+        Turn one flat JOIN row into a task dict with nested owner/assignee dicts.
+
+        The row must come from a query that selects, in this exact order:
+            tasks.id, tasks.title, tasks.description, tasks.status, tasks.priority,
+            tasks.owner_id, tasks.assignee_id, tasks.created_at, tasks.updated_at,
+            owner.id, owner.name, owner.email, owner.created_at,
+            assignee.id, assignee.name, assignee.email, assignee.created_at
+
+        Shared by get_by_id(), get_all() and get_by_ids() so the mapping lives in one place.
+
+        Args:
+            row: One result row (sqlite3.Row or tuple)
+            user_cache: Optional dict of user_id -> user dict, shared across the rows
+                        of ONE query. A user who owns or is assigned 50 tasks then
+                        gets one dict instead of 50 identical copies.
+
+        Why dicts and not dataclasses/namedtuples?
+        Templates use task.owner.name, controllers pass tasks to jsonify(), and the
+        dev panel serializes them - all of which work with plain dicts as-is.
+
+        ✅ DO: Unpack by position - no per-field name lookups on the row
+        ⚠️ DON'T: Reorder the SELECT columns without updating this unpacking
+        ⚠️ DON'T: Mutate task['owner'] / task['assignee'] in place - with a
+                  user_cache, that dict may be shared with other tasks
+        """
+        (task_id, title, description, status, priority,
+         owner_id, assignee_id, created_at, updated_at,
+         owner_user_id, owner_name, owner_email, owner_created_at,
+         assignee_user_id, assignee_name, assignee_email, assignee_created_at) = row
+
+        if user_cache is None:
+            user_cache = {}
+
+        owner = user_cache.get(owner_user_id)
+        if owner is None:
+            owner = user_cache[owner_user_id] = {
+                'id': owner_user_id,
+                'name': owner_name,
+                'email': owner_email,
+                'created_at': owner_created_at
+            }
+
+        # assignee is optional (LEFT JOIN gives NULLs when unassigned)
+        assignee = None
+        if assignee_user_id is not None:
+            assignee = user_cache.get(assignee_user_id)
+            if assignee is None:
+                assignee = user_cache[assignee_user_id] = {
+                    'id': assignee_user_id,
+                    'name': assignee_name,
+                    'email': assignee_email,
+                    'created_at': assignee_created_at
                 }
-                tasks.append(task)
 
-            return tasks
+        return {
+            'id': task_id,
+            'title': title,
+            'description': description,
+            'status': status,
+            'priority': priority,
+            'owner_id': owner_id,
+            'assignee_id': assignee_id,
+            'created_at': created_at,
+            'updated_at': updated_at,
+            'owner': owner,
+            'assignee': assignee
+        }
 
     @staticmethod
     @log_method_call
@@ -436,11 +876,12 @@ class Task:
         MVC Flow:
         1. Controller receives PUT/POST request with updated data
         2. Controller calls Task.update(task_id, title="New Title", status="done")
-        3. Model validates new data
-        4. Model checks if task exists
-        5. Model executes UPDATE query with updated_at timestamp
-        6. Model returns updated task dict
-        7. Controller renders success view with updated data
+        3. Model validates the fields being changed (no queries)
+        4. Model executes UPDATE ... RETURNING * with updated_at timestamp
+           (one statement: owner/assignee existence is checked in its WHERE clause;
+           no row returned means the task - or a user - doesn't exist)
+        5. Model returns updated task dict
+        6. Controller renders success view with updated data
 
         Args:
             task_id: The task's ID
@@ -461,62 +902,45 @@ class Task:
         ✅ DO: Validate before updating database
         ✅ DO: Update updated_at timestamp automatically
         ✅ DO: Allow partial updates (only update specified fields)
+        ✅ DO: Return the updated row from the UPDATE itself (RETURNING)
         ⚠️ DON'T: Update without validation - maintain data integrity
 
         Covered in: Lesson 4 (updating tasks, Lesson 7 demonstrates priority updates)
         """
-        # Check if task exists
-        existing_task = Task.get_by_id(task_id)
-        if not existing_task:
-            return None
-
-        # Get current values and merge with updates
-        # This allows partial updates while maintaining all required fields for validation
-        current_data = {
-            'title': existing_task['title'],
-            'description': existing_task['description'],
-            'status': existing_task['status'],
-            'priority': existing_task['priority'],
-            'owner_id': existing_task['owner_id'],
-            'assignee_id': existing_task['assignee_id']
-        }
-
-        # Update with provided kwargs
-        current_data.update(kwargs)
-
-        # Validate the complete updated data
-        Task.validate(
-            title=current_data['title'],
-            description=current_data['description'],
-            status=current_data['status'],
-            priority=current_data['priority'],
-            owner_id=current_data['owner_id'],
-            assignee_id=current_data['assignee_id']
-        )
-
-        # Build UPDATE query dynamically based on provided fields
-        # ✅ DO: Only update fields that were provided in kwargs
-        # ✅ DO: Always update updated_at timestamp
-        update_fields = []
-        update_values = []
-
-        for field in ['title', 'description', 'status', 'priority', 'owner_id', 'assignee_id']:
-            if field in kwargs:
-                update_fields.append(f"{field} = ?")
-                update_values.append(current_data[field])
-
-        # Always update the updated_at timestamp
-        update_fields.append("updated_at = CURRENT_TIMESTAMP")
-
-        # Add task_id for WHERE clause
-        update_values.append(task_id)
-
-        # Execute update query
-        query = f"UPDATE tasks SET {', '.join(update_fields)} WHERE id = ?"
-        execute_query(query, tuple(update_values), commit=True)
-
-        # Return updated task
-        return Task.get_by_id(task_id)
+        # Only the fields being changed are validated
+        # ✅ DO: Skip re-validating unchanged values - they were validated when saved
+        # ⚠️ DON'T: Fetch the current row just to "fill in" values for validation
+        fields = {field: kwargs[field] for field in Task.UPDATABLE_FIELDS if field in kwargs}
+        Task._validate_fields(fields)
+
+        # UPDATE query for exactly the provided fields (built once per field combination)
+        # fields keeps UPDATABLE_FIELDS order, so the same fields always give the same SQL
+        query = _update_sql(tuple(fields))
+
+        # Values in the same order as the SET clause, then task_id for WHERE,
+        # then the user IDs for the foreign key checks (only if being changed)
+        update_values = tuple(fields.values()) + (task_id,)
+        if 'owner_id' in fields:
+            update_values += (fields['owner_id'],)
+        if 'assignee_id' in fields:
+            update_values += (fields['assignee_id'], fields['assignee_id'])
+
+        # ✅ DO: Keep the write and any follow-up check in ONE transaction
+        with execute_transaction():
+            updated_task = execute_query(query, update_values, fetch_one=True, commit=True)
+
+            # No row updated: the task doesn't exist, or the owner/assignee doesn't.
+            # Only on this (rare) path do we run extra queries - to tell which
+            if updated_task is None and ('owner_id' in fields or fields.get('assignee_id') is not None):
+                # ✅ DO: Check the task first - a missing task is "not found" (None),
+                #    whatever user IDs were submitted with it
+                if execute_query(_TASK_EXISTS_SQL, (task_id,), fetch_one=True) is None:
+                    return None
+                Task._check_users_exist(fields.get('owner_id'), fields.get('assignee_id'),
+                                        check_owner='owner_id' in fields)
+
+            # Still None here means the task itself doesn't exist
+            return updated_task
 
     @staticmethod
     @log_method_call
@@ -527,10 +951,9 @@ class Task:
         MVC Flow:
         1. Controller receives DELETE request
         2. Controller calls Task.delete(task_id)
-        3. Model checks if task exists
-        4. Model executes DELETE query
-        5. Model returns success/failure boolean
-        6. Controller renders appropriate response
+        3. Model executes DELETE query
+        4. Model returns success/failure boolean (based on rows deleted)
+        5. Controller renders appropriate response
 
         Args:
             task_id: The task's ID to delete
@@ -550,19 +973,17 @@ class Task:
             - In a real app with comments/attachments, you'd need cascade logic
             - Lesson 8 covers building a Comment feature with cascade deletes
 
-        ✅ DO: Check if task exists before attempting delete
+        ✅ DO: Use the DELETE's row count to know if the task existed
         ✅ DO: Return boolean for clear success/failure indication
-        ⚠️ DON'T: Delete without checking existence first
+        ⚠️ DON'T: SELECT first just to check existence - it's an extra round-trip
 
         Covered in: Lesson 4 (basic delete), Lesson 8 (cascade delete with relationships)
         """
-        # Check if task exists
-        existing_task = Task.get_by_id(task_id)
-        if not existing_task:
-            return False
-
-        # Delete from database
-        query = "DELETE FROM tasks WHERE id = ?"
-        execute_query(query, (task_id,), commit=True)
-
-        return True
+        # Delete from database and check how many rows were removed
+        # ✅ DO: Let the DELETE tell us whether the task existed (rowcount)
+        #    One statement instead of "SELECT to check" + "DELETE"
+        query = _DELETE_SQL
+        deleted_count = execute_query(query, (task_id,), commit=True, return_rowcount=True)
+
+        # 0 rows deleted means the task didn't exist
+        return deleted_count > 0
@@ -20,11 +20,37 @@ Design Notes:
 """
 
 import re
-from typing import Dict, List, Optional
-from backend.database.connection import execute_query
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, FrozenSet, Optional, Tuple
+from backend.database.connection import execute_query, iter_query
 from backend.utils.decorators import log_method_call
 
 
+# In-memory cache of recently read users: {user_id: user dict}, oldest first
+# ✅ DO: Bound the cache (least recently used users are evicted first)
+# ✅ DO: Guard it with a lock - Flask may serve requests on several threads
+# Module-level (not User attributes): internal bookkeeping, reached without a class lookup
+_USER_CACHE: "OrderedDict[int, Dict[str, any]]" = OrderedDict()
+_USER_CACHE_MAX = 1024
+_USER_CACHE_LOCK = threading.Lock()
+
+
+def _forget_user(user_id: int) -> None:
+    """
+    Drop one user from the User.get_by_id() cache.
+
+    A plain module function rather than a User static method - it's private
+    bookkeeping, so create()/update()/delete() call it directly (no class
+    attribute lookup or staticmethod descriptor on every write).
+
+    ✅ DO: Call this after every write to a user row
+    """
+    with _USER_CACHE_LOCK:
+        _USER_CACHE.pop(user_id, None)
+
+
 class User:
     """
     User model for managing user data and operations.
@@ -40,11 +66,22 @@ class User:
 
     # Email validation regex pattern
     # ✅ DO: Define validation rules as class constants
-    EMAIL_PATTERN = r'^[\w\.-]+@[\w\.-]+\.\w+$'
+    # ✅ DO: Use explicit ASCII character classes and \A...\Z anchors - \Z (unlike $)
+    #    doesn't accept a trailing newline, and the TLD must be 2+ letters
+    # ⚠️ DON'T: Use \w here - it matches any Unicode letter or digit
+    EMAIL_PATTERN = r'\A[A-Za-z0-9._-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\Z'
+
+    # Compiled once when the class is defined - validate() just calls .match()
+    # ✅ DO: Precompile regexes used on every request (no pattern cache lookup per call)
+    EMAIL_REGEX = re.compile(EMAIL_PATTERN, re.ASCII)
+
+    # Most IDs bound in one "WHERE id IN (?, ?, ...)" query
+    # (older SQLite builds allow at most 999 ? parameters per statement)
+    IN_QUERY_BATCH_SIZE = 900
 
     @staticmethod
     @log_method_call
-    def validate(name: str, email: str) -> None:
+    def validate(name: str, email: str) -> Tuple[str, str]:
         """
         Validate user data before database operations.
 
@@ -53,7 +90,7 @@ class User:
         2. Controller calls User.validate() BEFORE attempting to save
         3. Model checks business rules (non-empty name, valid email)
         4. Raises ValueError if invalid (Controller will catch and show error)
-        5. If valid, returns None (Controller proceeds with create/update)
+        5. If valid, returns the cleaned (stripped) values to save
 
         Args:
             name: User's full name
@@ -63,31 +100,39 @@ class User:
             ValueError: If validation fails, with descriptive message
 
         Returns:
-            None if validation passes
+            (name, email) with leading/trailing whitespace removed - the values
+            create() and update() actually store
 
         Example:
-            >>> User.validate("Alice", "alice@example.com")  # OK, returns None
-            >>> User.validate("", "alice@example.com")       # Raises ValueError
-            >>> User.validate("Alice", "invalid-email")      # Raises ValueError
+            >>> User.validate(" Alice ", "alice@example.com")  # ('Alice', 'alice@example.com')
+            >>> User.validate("", "alice@example.com")         # Raises ValueError
+            >>> User.validate("Alice", "invalid-email")        # Raises ValueError
 
         ✅ DO: Validate data in Model before touching database
+        ✅ DO: Save the cleaned values - "  bob@example.com" shouldn't reach the database
         ⚠️ DON'T: Assume data is valid just because it came from a form
 
         Covered in: Lesson 3 (Model validation patterns)
         """
+        # Strip once - the stripped values are checked AND returned for saving
+        name = name.strip() if name else ''
+        email = email.strip() if email else ''
+
         # Check name is not empty
         # ✅ DO: Check for empty strings, not just None
-        if not name or not name.strip():
+        if not name:
             raise ValueError("Name is required and cannot be empty")
 
         # Check email format
         # ✅ DO: Use regex for email validation (simple but effective)
-        if not email or not email.strip():
+        if not email:
             raise ValueError("Email is required and cannot be empty")
 
-        if not re.match(User.EMAIL_PATTERN, email):
+        if not User.EMAIL_REGEX.match(email):
             raise ValueError(f"Email format invalid: {email}")
 
+        return name, email
+
     @staticmethod
     @log_method_call
     def create(name: str, email: str) -> Dict[str, any]:
@@ -125,9 +170,9 @@ class User:
 
         Covered in: Lesson 3 (creating users through Model layer)
         """
-        # Validate input data
+        # Validate input data (and use the cleaned values from here on)
         # This will raise ValueError if invalid - Controller handles the error
-        User.validate(name, email)
+        name, email = User.validate(name, email)
 
         # Insert into database
         # ✅ DO: Use parameterized queries (? placeholders) to prevent SQL injection
@@ -135,6 +180,10 @@ class User:
         query = "INSERT INTO users (name, email) VALUES (?, ?)"
         user_id = execute_query(query, (name, email), commit=True)
 
+        # A new user may be an ID that was cached as "doesn't exist"
+        User.existing_ids.cache_clear()
+        _forget_user(user_id)
+
         # Fetch and return the newly created user
         # This ensures we return data exactly as stored (with timestamp, etc.)
         return User.get_by_id(user_id)
@@ -158,6 +207,12 @@ class User:
         Returns:
             User dict if found, None if not found
 
+        Caching:
+            Found users are kept in an in-memory LRU cache (_USER_CACHE), so
+            asking for the same user again costs no query - you'll see the
+            method call in the Dev Panel, but no SELECT in the Database tab.
+            create(), update() and delete() drop the user from the cache.
+
         Example:
             >>> user = User.get_by_id(1)
             >>> if user:
@@ -170,8 +225,72 @@ class User:
 
         Covered in: Lesson 3 (reading data from Model)
         """
+        # Cache hit: no database round trip
+        with _USER_CACHE_LOCK:
+            cached = _USER_CACHE.get(user_id)
+            if cached is not None:
+                _USER_CACHE.move_to_end(user_id)
+                # ✅ DO: Hand out a copy - a caller editing its dict can't corrupt the cache
+                return dict(cached)
+
         query = "SELECT * FROM users WHERE id = ?"
-        return execute_query(query, (user_id,), fetch_one=True)
+        user = execute_query(query, (user_id,), fetch_one=True)
+        if user is None:
+            return None
+
+        with _USER_CACHE_LOCK:
+            _USER_CACHE[user_id] = user
+            _USER_CACHE.move_to_end(user_id)
+            if len(_USER_CACHE) > _USER_CACHE_MAX:
+                _USER_CACHE.popitem(last=False)  # Evict least recently used
+        return dict(user)
+
+    @staticmethod
+    @log_method_call
+    def get_many(user_ids: Iterable[int]) -> Dict[int, Dict[str, any]]:
+        """
+        Fetch several users by ID in ONE query.
+
+        MVC Flow:
+        1. Controller has a list of user IDs (e.g., owners of some tasks)
+        2. Controller calls User.get_many(ids) instead of User.get_by_id() in a loop
+        3. Model runs a single SELECT ... WHERE id IN (?, ?, ...)
+        4. Model returns {user_id: user dict} for easy lookup
+
+        Args:
+            user_ids: IDs to fetch (duplicates are fine)
+
+        Returns:
+            Dict mapping each found ID to its user dict - IDs that don't
+            exist are simply missing from the result
+
+        Example:
+            >>> users = User.get_many([1, 2, 99])
+            >>> users[1]['name']
+            'Alice Anderson'
+            >>> 99 in users
+            False
+
+        ✅ DO: Load related users in one query (N lookups -> 1 query)
+        ⚠️ DON'T: Call User.get_by_id() inside a loop - that's the N+1 problem
+
+        Covered in: Lesson 4 (avoiding N+1 queries)
+        """
+        # dict.fromkeys: drop duplicates but keep the order
+        ids = tuple(dict.fromkeys(user_ids))
+        users = {}
+
+        # Very long ID lists are split into batches (SQLite's parameter limit)
+        batch_size = User.IN_QUERY_BATCH_SIZE
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size]
+            # One ? placeholder per ID - values are still passed as parameters (no SQL injection)
+            placeholders = ', '.join('?' * len(batch))
+            query = f"SELECT * FROM users WHERE id IN ({placeholders})"
+            for row in execute_query(query, batch, fetch_all=True):
+                users[row['id']] = row
+
+        return users
 
     @staticmethod
     @log_method_call
@@ -199,10 +318,30 @@ class User:
 
         Covered in: Lesson 3 (listing users)
         """
+        # Materialize the streamed rows into a list (templates and jsonify need a list)
+        return list(User.iter_all())
+
+    @staticmethod
+    def iter_all() -> Iterator[Dict[str, any]]:
+        """
+        Like get_all(), but yields one user at a time instead of returning a list.
+
+        Rows are read from the database cursor as you loop, so only the current
+        user is held in memory - useful for exports or other one-pass loops
+        over a large table.
+
+        Example:
+            >>> for user in User.iter_all():
+            ...     write_csv_row(user)
+
+        Note: Not decorated with @log_method_call (same as Task.iter_all) -
+        a generator has nothing useful to log until it is consumed.
+
+        ✅ DO: Use this when you loop over the users exactly once
+        ⚠️ DON'T: Use it when you need len() or to loop twice - use get_all()
+        """
         query = "SELECT * FROM users ORDER BY created_at DESC"
-        result = execute_query(query, fetch_all=True)
-        # execute_query returns a list (empty if no results)
-        return result if result else []
+        yield from iter_query(query)
 
     @staticmethod
     @log_method_call
@@ -214,10 +353,9 @@ class User:
         1. Controller receives PUT/POST request with updated data
         2. Controller calls User.update(user_id, name, email)
         3. Model validates new data
-        4. Model checks if user exists
-        5. Model executes UPDATE query
-        6. Model returns updated user dict
-        7. Controller renders success view with updated data
+        4. Model executes UPDATE ... RETURNING * (one statement)
+        5. Model returns the updated row (None if no row matched the ID)
+        6. Controller renders success view with updated data
 
         Args:
             user_id: The user's ID
@@ -238,25 +376,24 @@ class User:
             ...     print("User not found")
 
         ✅ DO: Validate before updating database
-        ✅ DO: Check if user exists before attempting update
+        ✅ DO: Let RETURNING tell us if the user existed - no SELECT before or after
         ⚠️ DON'T: Update without validation - maintain data integrity
 
         Covered in: Lesson 3 (updating through Model layer)
         """
-        # Validate new data
-        User.validate(name, email)
+        # Validate new data (and use the cleaned values from here on)
+        name, email = User.validate(name, email)
 
-        # Check if user exists
-        existing_user = User.get_by_id(user_id)
-        if not existing_user:
-            return None
+        # Update database and get the updated row back in the same statement
+        # ✅ DO: Use RETURNING (SQLite 3.35+) instead of "SELECT to check" + UPDATE + SELECT
+        query = "UPDATE users SET name = ?, email = ? WHERE id = ? RETURNING *"
+        updated_user = execute_query(query, (name, email, user_id), fetch_one=True, commit=True)
 
-        # Update database
-        query = "UPDATE users SET name = ?, email = ? WHERE id = ?"
-        execute_query(query, (name, email, user_id), commit=True)
+        # The cached copy is now out of date
+        _forget_user(user_id)
 
-        # Return updated user
-        return User.get_by_id(user_id)
+        # None here means no user has this ID
+        return updated_user
 
     @staticmethod
     @log_method_call
@@ -267,10 +404,9 @@ class User:
         MVC Flow:
         1. Controller receives DELETE request
         2. Controller calls User.delete(user_id)
-        3. Model checks if user exists
-        4. Model executes DELETE query
-        5. Model returns success/failure boolean
-        6. Controller renders appropriate response
+        3. Model executes DELETE query
+        4. Model returns success/failure boolean (based on rows deleted)
+        5. Controller renders appropriate response
 
         Args:
             user_id: The user's ID to delete
@@ -290,19 +426,50 @@ class User:
             - Use soft deletes (mark as inactive instead of removing)
             - Cascade delete related records
 
-        ✅ DO: Check if user exists before attempting delete
+        ✅ DO: Use the DELETE's row count to know if the user existed
         ✅ DO: Return boolean for clear success/failure indication
         ⚠️ DON'T: Delete without checking for related data (covered in Lesson 4)
 
         Covered in: Lesson 3 (basic delete), Lesson 4 (relationships & cascading)
         """
-        # Check if user exists
-        existing_user = User.get_by_id(user_id)
-        if not existing_user:
+        # Delete from database and check how many rows were removed
+        # ✅ DO: Let the DELETE tell us whether the user existed (rowcount)
+        #    One statement instead of "SELECT to check" + "DELETE"
+        query = "DELETE FROM users WHERE id = ?"
+        deleted_count = execute_query(query, (user_id,), commit=True, return_rowcount=True)
+        if deleted_count == 0:
             return False
 
-        # Delete from database
-        query = "DELETE FROM users WHERE id = ?"
-        execute_query(query, (user_id,), commit=True)
+        # The deleted user may be cached as "exists"
+        User.existing_ids.cache_clear()
+        _forget_user(user_id)
 
         return True
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def existing_ids(user_ids: Tuple[int, ...]) -> FrozenSet[int]:
+        """
+        Return which of the given user IDs exist, remembering recent answers.
+
+        Used by Task validation to check owner_id/assignee_id. Creating or
+        updating many tasks for the same users would otherwise run the same
+        SELECT over and over - with the cache, repeated checks cost no query.
+
+        Args:
+            user_ids: Tuple of user IDs to check (a tuple so it can be a cache key)
+
+        Returns:
+            frozenset of the IDs that exist in the users table
+
+        Example:
+            >>> User.existing_ids((1, 99))
+            frozenset({1})
+
+        ✅ DO: Clear the cache whenever users are added or removed
+               (User.create and User.delete call existing_ids.cache_clear())
+        ⚠️ DON'T: Cache data that can change without a way to invalidate it
+        """
+        placeholders = ', '.join('?' * len(user_ids))
+        query = f"SELECT id FROM users WHERE id IN ({placeholders})"
+        return frozenset(row['id'] for row in execute_query(query, user_ids, fetch_all=True))
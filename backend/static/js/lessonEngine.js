@@ -573,7 +573,8 @@ class LessonEngine {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
-                    'Accept': 'application/json'
+                    'Accept': 'application/json',
+                    'X-Debug': '1'  // Ask the server to embed __DEBUG__ for the dev panel
                 },
                 body: JSON.stringify({
                     checkpoint_id: `lesson_${this.currentLesson.id}_checkpoint`,
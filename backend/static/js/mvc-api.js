@@ -25,6 +25,7 @@ class MvcApi {
             'Accept': 'application/json',
             'Content-Type': 'application/json',
             'X-Requested-With': 'XMLHttpRequest',  // Signal this is an XHR/async request
+            'X-Debug': '1',  // Ask the server to embed __DEBUG__ for the dev panel
             ...options.headers
         };
 
@@ -47,10 +48,14 @@ class MvcApi {
                 console.group(`📡 API Response: ${options.method || 'GET'} ${url}`);
                 console.log('Request ID:', data.__DEBUG__.request_id);
 
+                // Empty sections are left out of __DEBUG__ - treat them as []
+                const methodCalls = data.__DEBUG__.method_calls || [];
+                const dbQueries = data.__DEBUG__.db_queries || [];
+
                 // Method Calls - log each one individually for full expandability
-                console.group(`Method Calls (${data.__DEBUG__.method_calls.length})`);
-                data.__DEBUG__.method_calls.forEach((call, index) => {
-                    console.group(`${index + 1}. ${call.method_name} (${call.duration_ms}ms)`);
+                console.group(`Method Calls (${methodCalls.length})`);
+                methodCalls.forEach((call, index) => {
+                    console.group(`${index + 1}. ${call.method_name} (${(call.duration_ms || 0).toFixed(2)}ms)`);
                     console.log('Args:', call.args);
                     console.log('Kwargs:', call.kwargs);
                     console.log('Return Value:', call.return_value);
@@ -60,14 +65,14 @@ class MvcApi {
                 console.groupEnd();
 
                 // DB Queries
-                if (data.__DEBUG__.db_queries.length > 0) {
-                    console.group(`Database Queries (${data.__DEBUG__.db_queries.length})`);
-                    data.__DEBUG__.db_queries.forEach((query, index) => {
+                if (dbQueries.length > 0) {
+                    console.group(`Database Queries (${dbQueries.length})`);
+                    dbQueries.forEach((query, index) => {
                         console.group(`${index + 1}. ${query.query.substring(0, 50)}...`);
                         console.log('Query:', query.query);
                         console.log('Params:', query.params);
                         console.log('Rows:', query.result_row_count);
-                        console.log('Duration:', query.duration_ms + 'ms');
+                        console.log('Duration:', (query.duration_ms || 0).toFixed(2) + 'ms');
                         console.groupEnd();
                     });
                     console.groupEnd();
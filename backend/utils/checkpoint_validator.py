@@ -16,7 +16,7 @@ Learning Purpose:
 Design Notes:
 - NEVER uses eval() or exec() on raw user code without sandboxing
 - Whitelist approach for execution validators
-- 5-second timeout protection
+- 5-second timeout protection (CPU limit in a separate process)
 - Limited scope (no file I/O, network, subprocess)
 
 Lesson Reference:
@@ -25,11 +25,145 @@ Lesson Reference:
 """
 
 import ast
+import base64
+import json
+import marshal
+import math
+import os
 import re
 import signal
-from typing import Dict, List, Any, Optional
+import subprocess
+import sys
+from functools import cached_property, lru_cache
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Set, Tuple
 from backend.utils.decorators import log_method_call
 
+# resource (OS-level CPU/memory limits) only exists on Linux/macOS
+try:
+    import resource
+except ImportError:
+    # Windows: no OS limits, the wall-clock kill in _run_in_subprocess still applies
+    resource = None
+
+# Address-space limit for the process that runs student code (bytes)
+CHILD_MEMORY_LIMIT = 256 * 1024 * 1024
+
+# Exit codes of a child killed for running too long: -SIGKILL (hard CPU
+# limit on Linux) or -SIGXCPU (hard CPU limit elsewhere). subprocess reports
+# "killed by signal N" as -N
+_TIMEOUT_RETURNCODES = frozenset(
+    -getattr(signal, name) for name in ('SIGKILL', 'SIGXCPU') if hasattr(signal, name)
+)
+
+# Lines of the child's stderr shown when it fails without a result
+_STDERR_TAIL_LINES = 5
+
+# Directory containing the backend package - the child process runs from here
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@lru_cache(maxsize=512)
+def _compiled_pattern(pattern: str) -> re.Pattern:
+    """
+    Compile a checkpoint regex once and reuse it (cached).
+
+    Every student submitting the same checkpoint is checked against the same
+    few patterns from the lesson JSON, so each pattern is compiled on first use
+    and later submissions skip straight to .search().
+    """
+    return re.compile(pattern, re.MULTILINE)
+
+
+class _Submission:
+    """
+    Submitted code for static checks, plus derived views computed on first use.
+
+    Each view is built at most once per submission, and only if some check
+    actually needs it.
+    """
+
+    def __init__(self, source: str, tree: ast.AST):
+        self.source = source
+        self.tree = tree
+
+    @cached_property
+    def canonical(self) -> str:
+        """
+        The code re-generated from its AST (ast.unparse).
+
+        Comments and blank lines are gone, spacing is normalized and strings
+        use single quotes - so "email.endswith( \".edu\" )  # check" becomes
+        "email.endswith('.edu')".
+        """
+        return ast.unparse(self.tree)
+
+    @cached_property
+    def node_types(self) -> Set[type]:
+        """
+        The class of every AST node in the tree (e.g. {ast.Module, ast.Raise, ...}).
+
+        ✅ DO: Walk the tree ONCE, not once per ast_contains check
+        """
+        return {type(node) for node in ast.walk(self.tree)}
+
+
+# Static check functions - each answers one check: (arg, submission) -> passed?
+def _check_regex(pattern: re.Pattern, submission: _Submission) -> bool:
+    """Regex check: does the pattern appear anywhere in the code as written?"""
+    return pattern.search(submission.source) is not None
+
+
+def _check_regex_canonical(pattern: re.Pattern, submission: _Submission) -> bool:
+    """Regex check against the canonical (unparsed) code - see _Submission.canonical."""
+    return pattern.search(submission.canonical) is not None
+
+
+def _check_ast(node_classes: FrozenSet[type], submission: _Submission) -> bool:
+    """
+    AST check: does the code contain a node of one of these classes?
+
+    One C-level set operation (isdisjoint stops at the first match) - no
+    Python loop over the tree or the node types. An unknown node type name
+    resolves to an empty set, which never matches.
+    """
+    return not submission.node_types.isdisjoint(node_classes)
+
+
+@lru_cache(maxsize=None)
+def _ast_classes(node_type: Optional[str]) -> FrozenSet[type]:
+    """
+    Resolve a node type name like 'Raise' to the ast classes it matches (cached).
+
+    A concrete node type matches just itself; a base class like 'stmt' also
+    matches all of its subclasses (ast.Raise, ast.Assign, ...). Returns an
+    empty frozenset if the name isn't an ast node class.
+    """
+    node_class = getattr(ast, node_type or '', None)
+    if not (isinstance(node_class, type) and issubclass(node_class, ast.AST)):
+        return frozenset()
+
+    classes = set()
+    pending = [node_class]
+    while pending:
+        cls = pending.pop()
+        if cls not in classes:
+            classes.add(cls)
+            pending.extend(cls.__subclasses__())
+    return frozenset(classes)
+
+
+# Dispatch table: check 'type' -> function turning the check into (check function, argument)
+# ✅ DO: Look up the check function once per check type, not with if/elif per submission
+_CHECK_TYPES = {
+    # "target": "ast" runs the regex against the canonical code instead of the source
+    'regex': lambda check: (
+        _check_regex_canonical if check.get('target') == 'ast' else _check_regex,
+        _compiled_pattern(check.get('pattern', ''))
+    ),
+    # Resolve the node type name (e.g. 'Raise') to its ast classes once
+    'ast_contains': lambda check: (_check_ast, _ast_classes(check.get('node_type'))),
+}
+
 
 class CheckpointValidator:
     """
@@ -120,7 +254,8 @@ class CheckpointValidator:
         if validator_type == 'static':
             return CheckpointValidator.validate_static(
                 submitted_code,
-                checkpoint_config.get('checks', [])
+                checkpoint_config.get('checks', []),
+                fail_fast=checkpoint_config.get('fail_fast', False)
             )
         elif validator_type == 'execution':
             return CheckpointValidator.validate_execution(
@@ -140,7 +275,8 @@ class CheckpointValidator:
     @log_method_call
     def validate_static(
         submitted_code: str,
-        checks: List[Dict[str, Any]]
+        checks: List[Dict[str, Any]],
+        fail_fast: bool = False
     ) -> Dict[str, Any]:
         """
         Static analysis validation using regex and AST.
@@ -169,6 +305,13 @@ class CheckpointValidator:
                         'required': True
                     }
                 ]
+                A regex check may add 'target': 'ast' to match against the
+                canonical code (ast.unparse) instead of the raw source - no
+                comments, normalized spacing and quotes, so fewer false failures.
+            fail_fast: Stop at the first failed required check (set
+                       "fail_fast": true in the validator config). Use it when
+                       only pass/fail matters - errors then lists at most one
+                       message, and later checks never run.
 
         Returns:
             Validation result dict with passed, message, errors, hints
@@ -177,76 +320,40 @@ class CheckpointValidator:
         ✅ NO code execution - just regex and AST parsing
         ✅ Cannot harm system - syntax checking only
         ✅ Fast - no timeout needed
+        ✅ Memoized - the same code against the same checks is only analyzed once
 
         Covered in: Lesson 3 (static code validation pattern)
         """
-        errors = []
-        hints = []
+        # Checks are prepared once per distinct check list (cached by content -
+        # the lesson JSON is reloaded on every request, so the dicts are new each time)
+        prepared = _prepared_checks(_checks_key(checks))
 
-        # Parse AST for structure checks
-        try:
-            tree = ast.parse(submitted_code)
-        except SyntaxError as e:
-            return {
-                'passed': False,
-                'message': 'Syntax error in your code',
-                'errors': [f'Line {e.lineno}: {e.msg}'],
-                'hints': ['Check for missing colons, parentheses, or quotes']
-            }
-
-        # Run each check
-        for check in checks:
-            check_type = check.get('type', 'regex')
-            required = check.get('required', True)
-            message = check.get('message', 'Check failed')
-
-            if check_type == 'regex':
-                # Regex pattern matching
-                pattern = check.get('pattern', '')
-                if not re.search(pattern, submitted_code, re.MULTILINE):
-                    if required:
-                        errors.append(message)
-                    else:
-                        hints.append(message)
-
-            elif check_type == 'ast_contains':
-                # AST node type checking
-                node_type = check.get('node_type')
-                found = CheckpointValidator._ast_contains_node(tree, node_type)
-                if not found:
-                    if required:
-                        errors.append(message)
-                    else:
-                        hints.append(message)
-
-        # Determine if validation passed
-        passed = len(errors) == 0
+        # Same code + same checks = same result, so resubmissions are a cache lookup
+        result = _run_static_checks(submitted_code, prepared, fail_fast)
 
+        # ✅ DO: Return a copy - callers may modify the result, the cached one must not change
         return {
-            'passed': passed,
-            'message': 'All checks passed!' if passed else 'Some checks failed',
-            'errors': errors if errors else None,
-            'hints': hints if hints else None
+            key: list(value) if isinstance(value, list) else value
+            for key, value in result.items()
         }
 
     @staticmethod
-    def _ast_contains_node(tree: ast.AST, node_type: str) -> bool:
+    def prepare_checks(checks: List[Dict[str, Any]]) -> List[Tuple[Callable, Any, bool, str]]:
         """
-        Check if AST contains a specific node type.
+        Turn check definitions from the lesson JSON into ready-to-run tuples.
 
-        Used for checking code structure (e.g., does it have a Raise node?)
+        All the per-check work that doesn't depend on the submission happens
+        here, once: reading the dict keys, picking the check function and
+        compiling regex patterns.
 
         Args:
-            tree: AST tree to search
-            node_type: Name of AST node type (e.g., 'Raise', 'FunctionDef')
+            checks: Check definitions (see validate_static)
 
         Returns:
-            True if node type found, False otherwise
+            [(check_function, argument, required, message), ...]
+            Checks with an unknown type are skipped.
         """
-        for node in ast.walk(tree):
-            if type(node).__name__ == node_type:
-                return True
-        return False
+        return list(_prepared_checks(_checks_key(checks)))
 
     @staticmethod
     @log_method_call
@@ -260,13 +367,13 @@ class CheckpointValidator:
         Sandboxed execution validation.
 
         MVC Flow:
-        1. Parse code to AST (syntax check)
-        2. Create restricted namespace (whitelist built-ins only)
-        3. Set timeout handler
-        4. Execute code in sandbox
-        5. Extract and test function
-        6. Verify outputs match expected results
-        7. Return detailed results
+        1. Compile code to bytecode (syntax check, cached)
+        2. Start a child process with CPU-time and memory limits
+        3. Child creates restricted namespace (whitelist built-ins only)
+        4. Child executes code in sandbox
+        5. Child extracts and tests the function
+        6. Child verifies outputs match expected results
+        7. Return detailed results (or a timeout if the child is killed)
 
         Args:
             submitted_code: Code to execute
@@ -279,18 +386,22 @@ class CheckpointValidator:
                     }
                 ]
             function_name: Name of function to test
-            timeout: Max execution time in seconds
+            timeout: Max execution time in seconds (rounded up to whole
+                     seconds; zero, negative or missing uses EXECUTION_TIMEOUT)
 
         Returns:
             Validation result dict with passed, message, errors
 
         Security Measures:
         ✅ Whitelist built-ins - no dangerous imports
-        ✅ Timeout protection - 5 second max (signal.alarm)
+        ✅ Separate process - student code never runs inside the Flask worker
+        ✅ Timeout protection - CPU-time limit (RLIMIT_CPU) plus a wall-clock kill
+        ✅ Memory limit - 256 MB address space (RLIMIT_AS)
         ✅ No file I/O - cannot access filesystem
         ✅ No network - cannot make connections
         ✅ No subprocess - cannot run external programs
-        ⚠️ Note: signal.alarm() is Linux/macOS only
+        ⚠️ Note: CPU/memory limits need the resource module (Linux/macOS);
+           elsewhere only the wall-clock kill applies
 
         Example for Lesson 6:
         - Extract Task.by_status() function
@@ -299,9 +410,10 @@ class CheckpointValidator:
 
         Covered in: Lessons 6, 7, 8 (execution validation)
         """
-        # Parse code to validate syntax
+        # Compile code to validate syntax (here, so syntax errors skip the child process)
+        # The compiled bytecode is what the child runs - it never recompiles
         try:
-            tree = ast.parse(submitted_code)
+            bytecode, defined_names = _compile_student(submitted_code)
         except SyntaxError as e:
             return {
                 'passed': False,
@@ -309,98 +421,396 @@ class CheckpointValidator:
                 'errors': [f'Line {e.lineno}: {e.msg}']
             }
 
-        # Create restricted globals namespace
-        # ✅ DO: Use whitelist approach - only allow safe built-ins
-        # ⚠️ DON'T: Use 'eval' or 'compile' with eval mode
-        safe_globals = {
-            '__builtins__': CheckpointValidator.SAFE_BUILTINS,
-            '__name__': '__student_code__',
-        }
+        # Nothing to run: the config only checks that the code loads
+        # ✅ DO: Skip starting a process when there is nothing to test
+        if not test_cases:
+            return {
+                'passed': True,
+                'message': 'Syntax OK (no test cases)'
+            }
 
-        # Set up timeout handler
-        def timeout_handler(signum, frame):
-            raise TimeoutError(f"Code execution timed out after {timeout} seconds")
+        # Can't test without knowing which function to call (checkpoint config error)
+        if function_name is None:
+            return {
+                'passed': False,
+                'message': 'Checkpoint has no function to test',
+                'errors': ['Validator config is missing "function_name"']
+            }
 
-        # Execute code in sandbox
-        try:
-            # Install timeout handler
-            signal.signal(signal.SIGALRM, timeout_handler)
-            signal.alarm(timeout)
-
-            # Execute student code
-            # ✅ Using compiled AST and restricted globals for safety
-            exec(compile(tree, '<student_code>', 'exec'), safe_globals)
-
-            # Extract the function
-            if function_name not in safe_globals:
-                return {
-                    'passed': False,
-                    'message': f'Function "{function_name}" not found in your code',
-                    'errors': [f'Expected to find function: {function_name}']
-                }
-
-            student_function = safe_globals[function_name]
-
-            # Run test cases
-            failed_tests = []
-            for i, test_case in enumerate(test_cases):
-                try:
-                    test_input = test_case.get('input', {})
-                    expected = test_case.get('expected')
-                    description = test_case.get('description', f'Test {i+1}')
-
-                    # Call function with test input
-                    result = student_function(**test_input)
-
-                    # Check result
-                    if result != expected:
-                        failed_tests.append({
-                            'description': description,
-                            'expected': expected,
-                            'actual': result
-                        })
-                except Exception as e:
-                    failed_tests.append({
-                        'description': test_case.get('description', f'Test {i+1}'),
-                        'error': str(e)
-                    })
+        # Zero/negative would mean an instant kill (or no limit at all)
+        # ✅ DO: Always run untrusted code with a limit - fall back to the default
+        if not timeout or timeout <= 0:
+            timeout = CheckpointValidator.EXECUTION_TIMEOUT
+        # RLIMIT_CPU counts whole seconds
+        timeout = math.ceil(timeout)
+
+        # The function provably isn't defined at the top level - fail without running anything
+        # ✅ DO: Reject provably-wrong submissions before paying for a process
+        # ⚠️ DON'T: Reject when unsure (defined_names is None) - the child's
+        #    "not found" check stays the final answer
+        if defined_names is not None and function_name not in defined_names:
+            return {
+                'passed': False,
+                'message': f'Function "{function_name}" not found in your code',
+                'errors': [f'Expected to find function: {function_name}']
+            }
+
+        # Run the student code in a separate process with hard limits
+        # ✅ DO: Isolate untrusted code in its own process - an infinite loop or a
+        #    huge allocation kills that process, never the Flask worker
+        return _run_in_subprocess(bytecode, function_name, test_cases, timeout)
+
+
+@lru_cache(maxsize=256)
+def _compile_student(source: str) -> Tuple[bytes, Optional[FrozenSet[str]]]:
+    """
+    Compile student code to serialized bytecode (cached).
+
+    Resubmitting identical code (retries, a teacher re-running a class's
+    answers) reuses the cached bytecode instead of parsing and compiling again.
+
+    Returns:
+        (bytecode, defined_names)
+        - bytecode: marshal-serialized code object - the child process runs
+          the same Python (sys.executable), so it can load it directly
+        - defined_names: every name the code binds at the top level, or
+          None if that can't be known without running it (see
+          _module_level_names)
+
+    Raises:
+        SyntaxError: If the code doesn't parse
+    """
+    tree = ast.parse(source)
+    bytecode = marshal.dumps(compile(tree, '<student_code>', 'exec'))
+    return bytecode, _module_level_names(tree)
+
+
+# Statements that only bind names through their own fields - anything else
+# at the top level (if/try/with/for/while/match...) may define names inside
+# its body, so the pre-check gives up and lets the code run
+_SIMPLE_STATEMENTS = (
+    ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef,
+    ast.Assign, ast.AnnAssign, ast.AugAssign,
+    ast.Import, ast.ImportFrom,
+    ast.Expr, ast.Pass, ast.Delete, ast.Assert, ast.Global,
+)
 
-            # Cancel timeout
-            signal.alarm(0)
-
-            # Return results
-            if failed_tests:
-                return {
-                    'passed': False,
-                    'message': f'{len(failed_tests)} test(s) failed',
-                    'errors': [
-                        f"{t['description']}: Expected {t.get('expected')}, got {t.get('actual', 'error: ' + t.get('error'))}"
-                        for t in failed_tests
-                    ]
-                }
+# Calls that can bind module names at runtime (exec("def f..."), globals()['f'] = ...)
+_DYNAMIC_BINDERS = frozenset({'exec', 'eval', 'globals', 'locals', 'vars', 'setattr', '__import__'})
+
+
+def _module_level_names(tree: ast.Module) -> Optional[FrozenSet[str]]:
+    """
+    Names bound at module scope, or None when a static scan can't be sure.
+
+    Used only to reject a submission early - so every doubt returns None:
+    compound statements, tuple/attribute/subscript assignment targets,
+    walrus expressions and dynamic binders like exec() or globals().
+    """
+    names = set()
+    for node in tree.body:
+        if not isinstance(node, _SIMPLE_STATEMENTS):
+            return None
+
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign, ast.AugAssign)):
+            targets = node.targets if isinstance(node, ast.Assign) else [node.target]
+            if not all(isinstance(target, ast.Name) for target in targets):
+                return None
+            names.update(target.id for target in targets)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            # "import a.b" binds "a"; "from m import x as y" binds "y"
+            names.update(
+                alias.asname or alias.name.split('.')[0] for alias in node.names
+            )
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.NamedExpr):
+            return None
+        if isinstance(node, ast.Name) and node.id in _DYNAMIC_BINDERS:
+            return None
+
+    return frozenset(names)
+
+
+def _checks_key(checks: List[Dict[str, Any]]) -> str:
+    """Hashable cache key for a list of check definitions (canonical JSON)."""
+    return json.dumps(checks, sort_keys=True)
+
+
+@lru_cache(maxsize=256)
+def _prepared_checks(checks_key: str) -> Tuple[Tuple[Callable, Any, bool, str], ...]:
+    """
+    Prepare the checks encoded in checks_key (cached - see prepare_checks).
+
+    Keyed by content rather than by dict identity: equal check lists from
+    separately loaded lesson files share one prepared tuple.
+    """
+    prepared = []
+    for check in json.loads(checks_key):
+        prepare = _CHECK_TYPES.get(check.get('type', 'regex'))
+        if prepare is None:
+            continue
+        check_fn, arg = prepare(check)
+        prepared.append((
+            check_fn,
+            arg,
+            check.get('required', True),
+            check.get('message', 'Check failed'),
+        ))
+    return tuple(prepared)
+
+
+@lru_cache(maxsize=1024)
+def _run_static_checks(
+    submitted_code: str,
+    prepared: Tuple[Tuple[Callable, Any, bool, str], ...],
+    fail_fast: bool
+) -> Dict[str, Any]:
+    """
+    Run prepared static checks against the code (cached - see validate_static).
+
+    Static validation never runs the code, so the result depends only on
+    these arguments. Prepared checks are hashable (functions, compiled
+    patterns, frozensets, strings), so the whole call can be memoized:
+    a student pressing "Validate" again with unchanged code gets the cached
+    result without parsing or scanning anything.
+
+    Returns:
+        Validation result dict (shared by the cache - don't modify it)
+    """
+    errors = []
+    hints = []
+
+    # Parse AST for structure checks
+    try:
+        tree = ast.parse(submitted_code)
+    except SyntaxError as e:
+        return {
+            'passed': False,
+            'message': 'Syntax error in your code',
+            'errors': [f'Line {e.lineno}: {e.msg}'],
+            'hints': ['Check for missing colons, parentheses, or quotes']
+        }
+
+    # Canonical code and node types are computed lazily, once, if a check needs them
+    submission = _Submission(submitted_code, tree)
+
+    # Run each check
+    for check_fn, arg, required, message in prepared:
+        if not check_fn(arg, submission):
+            if required:
+                errors.append(message)
+                if fail_fast:
+                    break
             else:
-                return {
-                    'passed': True,
-                    'message': f'All {len(test_cases)} test(s) passed!'
-                }
+                hints.append(message)
+
+    # Determine if validation passed
+    passed = len(errors) == 0
+
+    return {
+        'passed': passed,
+        'message': 'All checks passed!' if passed else 'Some checks failed',
+        'errors': errors if errors else None,
+        'hints': hints if hints else None
+    }
+
+
+def _run_in_subprocess(
+    bytecode: bytes,
+    function_name: str,
+    test_cases: List[Dict[str, Any]],
+    timeout: int
+) -> Dict[str, Any]:
+    """
+    Run student code in a fresh Python process and return its validation result.
+
+    The child is this module run as a script (python -m
+    backend.utils.checkpoint_validator, see _child_main). It sets its own
+    CPU-time and memory limits before running anything. The parent waits at
+    most timeout + 1 seconds of wall-clock time, then kills the child.
+
+    Why a process instead of signal.alarm()?
+    - Works under any WSGI worker model (signal handlers only work in the main
+      thread, so threaded servers couldn't use them)
+    - CPU limits are enforced by the OS, even inside a tight loop
+    - A crash in the child can't take the server down with it
+
+    Returns:
+        Same result dict as validate_execution()
+    """
+    job = json.dumps({
+        'bytecode': base64.b64encode(bytecode).decode('ascii'),
+        'function_name': function_name,
+        'test_cases': test_cases,
+        'timeout': timeout,
+    })
+
+    try:
+        # A clean interpreter - nothing from the Flask process (open database
+        # connections, request state) is inherited
+        completed = subprocess.run(
+            [sys.executable, '-m', 'backend.utils.checkpoint_validator'],
+            input=job,
+            capture_output=True,
+            text=True,
+            cwd=_PROJECT_ROOT,
+            timeout=timeout + 1
+        )
+    except subprocess.TimeoutExpired:
+        completed = None
+
+    # Killed for running too long (wall-clock timeout or hard CPU limit)
+    if completed is None or completed.returncode in _TIMEOUT_RETURNCODES:
+        return {
+            'passed': False,
+            'message': 'Code execution timeout',
+            'errors': [f"Code execution timed out after {timeout} seconds"],
+            'hints': ['Your code might have an infinite loop']
+        }
+
+    try:
+        return json.loads(completed.stdout)
+    except ValueError:
+        # No (complete) result: the child failed for another reason - e.g. it
+        # couldn't import this module. That's a server problem, not the student's
+        # ⚠️ DON'T: Report this as a timeout - it would blame the student's code
+        stderr_tail = completed.stderr.strip().splitlines()[-_STDERR_TAIL_LINES:]
+        return {
+            'passed': False,
+            'message': 'Checkpoint validator error',
+            'errors': [f"The validation process failed (exit code {completed.returncode})"]
+                      + stderr_tail
+        }
+
+
+def _child_main() -> None:
+    """
+    Child process entry point: apply limits, run the tests, print the result.
+
+    Reads the job from stdin and writes the result dict to stdout as JSON.
+    Everything in the result is plain strings/bools (the error messages are
+    formatted in _run_student_tests), so it always serializes cleanly.
+    """
+    job = json.load(sys.stdin)
+    timeout = job['timeout']
+
+    # Raised when the soft CPU limit is reached
+    def timeout_handler(signum, frame):
+        raise TimeoutError(f"Code execution timed out after {timeout} seconds")
+
+    # ✅ DO: Limit CPU time and memory at the OS level (Linux/macOS)
+    # The hard CPU limit (one second later) kills the process outright
+    # (This is the child's main thread, so installing a signal handler is allowed -
+    # unlike in a threaded Flask worker, where signal.signal() raises ValueError)
+    if resource is not None and hasattr(signal, 'SIGXCPU'):
+        signal.signal(signal.SIGXCPU, timeout_handler)
+        resource.setrlimit(resource.RLIMIT_CPU, (timeout, timeout + 1))
+        resource.setrlimit(resource.RLIMIT_AS, (CHILD_MEMORY_LIMIT, CHILD_MEMORY_LIMIT))
+
+    # Student code may print() - keep that out of the JSON result on stdout
+    result_stream, sys.stdout = sys.stdout, sys.stderr
+
+    bytecode = base64.b64decode(job['bytecode'])
+    result = _run_student_tests(bytecode, job['function_name'], job['test_cases'])
+    json.dump(result, result_stream)
+
+
+def _run_student_tests(
+    bytecode: bytes,
+    function_name: str,
+    test_cases: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Execute the student code in a restricted namespace and run each test case.
+
+    Runs inside the child process (see _child_main), after the limits are
+    in place.
+
+    Returns:
+        Same result dict as validate_execution()
+    """
+    # Create restricted globals namespace
+    # ✅ DO: Use whitelist approach - only allow safe built-ins
+    # ⚠️ DON'T: Use 'eval' or 'compile' with eval mode
+    safe_globals = {
+        '__builtins__': CheckpointValidator.SAFE_BUILTINS,
+        '__name__': '__student_code__',
+    }
+
+    # Execute code in sandbox
+    try:
+        # Execute student code
+        # ✅ Using code compiled by the parent (_compile_student) and restricted globals
+        exec(marshal.loads(bytecode), safe_globals)
 
-        except TimeoutError as e:
-            signal.alarm(0)
+        # Extract the function
+        if function_name not in safe_globals:
             return {
                 'passed': False,
-                'message': 'Code execution timeout',
-                'errors': [str(e)],
-                'hints': ['Your code might have an infinite loop']
+                'message': f'Function "{function_name}" not found in your code',
+                'errors': [f'Expected to find function: {function_name}']
             }
 
-        except Exception as e:
-            signal.alarm(0)
+        student_function = safe_globals[function_name]
+
+        # Run test cases
+        failed_tests = []
+        for i, test_case in enumerate(test_cases):
+            try:
+                test_input = test_case.get('input', {})
+                expected = test_case.get('expected')
+                description = test_case.get('description', f'Test {i+1}')
+
+                # Call function with test input
+                result = student_function(**test_input)
+
+                # Check result
+                if result != expected:
+                    failed_tests.append({
+                        'description': description,
+                        'expected': expected,
+                        'actual': result
+                    })
+            except Exception as e:
+                failed_tests.append({
+                    'description': test_case.get('description', f'Test {i+1}'),
+                    'error': str(e)
+                })
+
+        # Return results
+        if failed_tests:
             return {
                 'passed': False,
-                'message': 'Error executing your code',
-                'errors': [str(e)]
+                'message': f'{len(failed_tests)} test(s) failed',
+                'errors': [
+                    f"{t['description']}: Expected {t.get('expected')}, got {t.get('actual', 'error: ' + t.get('error'))}"
+                    for t in failed_tests
+                ]
+            }
+        else:
+            return {
+                'passed': True,
+                'message': f'All {len(test_cases)} test(s) passed!'
             }
 
-        finally:
-            # Always cancel timeout
-            signal.alarm(0)
+    except TimeoutError as e:
+        return {
+            'passed': False,
+            'message': 'Code execution timeout',
+            'errors': [str(e)],
+            'hints': ['Your code might have an infinite loop']
+        }
+
+    except Exception as e:
+        return {
+            'passed': False,
+            'message': 'Error executing your code',
+            'errors': [str(e)]
+        }
+
+
+if __name__ == '__main__':
+    _child_main()
@@ -18,13 +18,79 @@ Design Notes:
 - Handles exceptions by logging them without re-raising (passes through)
 - Truncates large return values to prevent bloating debug object
 - Gracefully skips logging if Flask request context unavailable
+- Can be switched off entirely with METHOD_TRACKING=0 (zero overhead when off)
 """
 
 import functools
+import os
+import reprlib
+import sys
 import time
 import json
 from typing import Any, Callable
 
+# Imported once here, not inside every wrapper call
+# (g and request are proxies - they resolve to the current request when used)
+from flask import g, has_app_context, request
+
+from backend.utils.request_tracker import append_method_call
+
+
+# Method call tracking switch
+# Tracking is ON by default - the developer panel is the point of this app.
+# Set METHOD_TRACKING=0 (benchmarks, production) and @log_method_call returns
+# each function unchanged: no wrapper frame, no argument copying, no timing.
+# ⚠️ Read once at import time - decorators are applied when modules load
+TRACKING_ENABLED = os.environ.get('METHOD_TRACKING', '1').strip().lower() not in ('0', 'false', 'no', 'off')
+
+
+def enable_tracking() -> None:
+    """
+    Turn method call tracking on for functions decorated from now on.
+
+    ⚠️ Functions that were already decorated keep their current behavior -
+    the switch is read once, when @log_method_call is applied (module import).
+    Call this before importing models/controllers (e.g. in a test setup),
+    or set METHOD_TRACKING and restart the app.
+    """
+    global TRACKING_ENABLED
+    TRACKING_ENABLED = True
+
+
+def disable_tracking() -> None:
+    """
+    Turn method call tracking off for functions decorated from now on.
+
+    Decorated functions are then returned unchanged - no wrapper, no overhead.
+    Same caveat as enable_tracking(): call before the models are imported.
+    """
+    global TRACKING_ENABLED
+    TRACKING_ENABLED = False
+
+
+# What kind of callable @log_method_call wrapped (decided once, at decoration time)
+_KIND_INSTANCE = 0    # def method(self, ...) inside a class - logged as "ClassName.method"
+_KIND_STATIC = 1      # static/class method - __qualname__ is already "ClassName.method"
+_KIND_CONTROLLER = 2  # plain module function - a Flask route handler
+
+# Argument types that are already JSON-serializable and logged as-is
+# ✅ DO: Check exact types with "type(x) in _PRIM_SET" (one hash lookup, no MRO walk)
+_PRIM_SET = frozenset({str, int, float, bool, type(None)})
+
+# Containers longer than this are measured item by item in _truncate_value()
+_SMALL_CONTAINER_LEN = 20
+
+# Short representation for non-primitive arguments, e.g. "[1, 2, 3, 4, 5, ...]"
+# ✅ DO: Use reprlib for lists/dicts/tuples - it stops after a few items instead of
+#    building the full text of a 10 000-item list and cutting it to 100 chars
+_ARG_REPR = reprlib.Repr()
+_ARG_REPR.maxstring = 100
+_ARG_REPR.maxother = 100
+_ARG_REPR.maxlist = 5
+_ARG_REPR.maxtuple = 5
+_ARG_REPR.maxset = 5
+_ARG_REPR.maxdict = 5
+
 
 def log_method_call(func: Callable) -> Callable:
     """
@@ -57,6 +123,8 @@ def log_method_call(func: Callable) -> Callable:
     - Methods called outside request context: skips logging gracefully
     - Static methods vs instance methods: handles both correctly
     - Methods with sensitive data: optional filtering (future enhancement)
+    - Tracking disabled (METHOD_TRACKING=0): returns func itself, so hot paths
+      like Task.get_by_id() pay no decorator cost at all
 
     Example Usage:
     ```python
@@ -76,73 +144,72 @@ def log_method_call(func: Callable) -> Callable:
 
     Returns:
         Wrapped function that logs invocations and returns original result
+        (or func unchanged when tracking is disabled)
 
     Covered in: Lesson 2 (making method calls visible),
                 Lesson 3 (logging Model methods)
     """
+    if not TRACKING_ENABLED:
+        # No dev panel logging - skip the wrapper entirely
+        return func
+
+    # Work out everything that doesn't change between calls ONCE, here.
+    # The wrapper runs on every call, so it only reads these closure variables.
+    # ✅ DO: Move per-call introspection (hasattr, string building) to decoration time
+    # Interned: every log entry for this method shares one name string
+    func_name = func.__name__
+    qualname = sys.intern(func.__qualname__)
+    if '.' not in qualname:
+        # Regular function (likely a Flask route handler / controller method)
+        kind = _KIND_CONTROLLER
+    elif getattr(func, '__code__', None) and func.__code__.co_argcount and \
+            func.__code__.co_varnames[0] == 'self':
+        # Instance method: the class name comes from args[0] ('self') at call time
+        kind = _KIND_INSTANCE
+    else:
+        # Static method or class method: __qualname__ contains "ClassName.method_name"
+        kind = _KIND_STATIC
+
+    # Each kind gets its own wrapper containing only the code it needs
+    # ✅ DO: Decide "which kind of function is this?" once, not on every call
+    if kind == _KIND_CONTROLLER:
+        return _wrap_controller(func, func_name)
+    if kind == _KIND_INSTANCE:
+        return _wrap_instance(func, func_name)
+    return _wrap_static(func, func_name, qualname)
+
+
+def _note_controller_name(func_name: str) -> None:
+    """
+    Set g.controller_name for the devPanel Network Inspector.
+
+    Uses request.endpoint which gives us "blueprint.function_name" (e.g., "tasks.create").
+    Wrappers call this only while it isn't set yet (first decorated function wins -
+    the route handler). This ensures POST requests display controller name just like GET requests.
+    """
+    try:
+        # request.endpoint gives us "blueprint.function" format
+        # e.g., "tasks.create", "users.index", "lessons.validate_checkpoint"
+        g.controller_name = request.endpoint or func_name
+    except RuntimeError:
+        # No request context - use function name as fallback
+        g.controller_name = func_name
+
+
+def _wrap_static(func: Callable, func_name: str, method_name: str) -> Callable:
+    """
+    @log_method_call wrapper for static and class methods (e.g. User.create).
 
+    method_name is the function's __qualname__ ("ClassName.method_name"),
+    fixed at decoration time. All arguments are logged.
+    """
     @functools.wraps(func)
     def wrapper(*args, **kwargs) -> Any:
-        # Try to import Flask components (fail gracefully if not in request context)
-        try:
-            from flask import g, request
-        except RuntimeError:
-            # Not in Flask request context - just run the function
+        # Outside Flask (scripts, shell) there is nowhere to log - just run the function
+        if not has_app_context():
             return func(*args, **kwargs)
-
-        # Set controller name for devPanel Network Inspector
-        # Uses request.endpoint which gives us "blueprint.function_name" (e.g., "tasks.create")
-        # Only set if not already set (first decorated function wins - the route handler)
-        # This ensures POST requests display controller name just like GET requests
-        if not hasattr(g, 'controller_name') or g.controller_name == 'Unknown':
-            try:
-                # request.endpoint gives us "blueprint.function" format
-                # e.g., "tasks.create", "users.index", "lessons.validate_checkpoint"
-                g.controller_name = request.endpoint or func.__name__
-            except RuntimeError:
-                # No request context - use function name as fallback
-                g.controller_name = func.__name__
-
-        # Extract method name for logging
-        # For instance methods, args[0] is 'self' - extract class from it
-        # For static methods, use __qualname__ which has format "ClassName.method_name"
-        is_controller_method = False
-        if args and hasattr(args[0], '__class__') and \
-           hasattr(args[0].__class__, func.__name__):
-            # Instance method: include class name
-            class_name = args[0].__class__.__name__
-            method_name = f"{class_name}.{func.__name__}"
-            logged_args = args[1:]  # Remove 'self' from args
-        elif '.' in func.__qualname__:
-            # Static method or class method: __qualname__ contains "ClassName.method_name"
-            method_name = func.__qualname__
-            logged_args = args
-        else:
-            # Regular function (likely a Flask route handler / controller method)
-            # Use request.endpoint for qualified name (e.g., "users.create", "tasks.index")
-            # This makes controller methods show up properly in the Method Calls list
-            is_controller_method = True
-            try:
-                method_name = request.endpoint or func.__name__
-            except RuntimeError:
-                method_name = func.__name__
-            logged_args = args
-
-        # For controller methods, log at the START of execution
-        # This is critical because success_response() captures tracking data before
-        # the controller method finishes, so we need to log before calling the function
-        # We'll store the log entry index to update duration after execution
-        controller_log_index = None
-        if is_controller_method and hasattr(g, 'tracking'):
-            controller_log_index = len(g.tracking['method_calls'])
-            _log_method_call(
-                method_name=method_name,
-                args=_sanitize_args(logged_args),
-                kwargs=_sanitize_kwargs(kwargs),
-                return_value='[pending]',
-                duration_ms=0,
-                exception=None
-            )
+        if g.get('controller_name', 'Unknown') == 'Unknown':
+            _note_controller_name(func_name)
 
         # Record start time (using perf_counter for more accurate timing)
         # perf_counter is better than time.time() because:
@@ -154,77 +221,180 @@ def log_method_call(func: Callable) -> Callable:
         # Call the actual method
         # We don't catch exceptions here - they should propagate
         # But we do log them before they propagate
-        exception_occurred = None
-        result = None
-
         try:
             result = func(*args, **kwargs)
         except Exception as e:
-            # Record that an exception occurred
-            exception_occurred = e
             # Calculate duration before re-raising
-            duration_ms = (time.perf_counter() - start_time) * 1000
-
-            # For controller methods, update the existing log entry
-            if is_controller_method and controller_log_index is not None:
-                if hasattr(g, 'tracking') and controller_log_index < len(g.tracking['method_calls']):
-                    g.tracking['method_calls'][controller_log_index]['duration_ms'] = round(duration_ms, 2)
-                    g.tracking['method_calls'][controller_log_index]['exception'] = str(e)
-                    g.tracking['method_calls'][controller_log_index]['return_value'] = None
-            else:
-                # Log the exception call for non-controller methods
-                _log_method_call(
-                    method_name=method_name,
-                    args=_sanitize_args(logged_args),
-                    kwargs=_sanitize_kwargs(kwargs),
-                    return_value=None,
-                    duration_ms=round(duration_ms, 2),
-                    exception=str(e)
-                )
+            end_time = time.perf_counter()
+            _log_method_call(
+                method_name=method_name,
+                args=_sanitize_args(args),
+                kwargs=_sanitize_kwargs(kwargs),
+                return_value=None,
+                duration_ms=(end_time - start_time) * 1000,
+                exception=str(e),
+                clock=end_time
+            )
             # Re-raise the exception so normal error handling continues
             raise
 
         # Calculate duration in milliseconds
-        duration_ms = (time.perf_counter() - start_time) * 1000
+        # (end_time also gives the log entry its timestamp - no extra clock read)
+        end_time = time.perf_counter()
+
+        # Log the call - the return value is truncated if too large
+        _log_method_call(
+            method_name=method_name,
+            args=_sanitize_args(args),
+            kwargs=_sanitize_kwargs(kwargs),
+            return_value=_truncate_value(result),
+            duration_ms=(end_time - start_time) * 1000,
+            exception=None,
+            clock=end_time
+        )
 
-        # For controller methods, update the existing log entry with final data
-        if is_controller_method and controller_log_index is not None:
-            if hasattr(g, 'tracking') and controller_log_index < len(g.tracking['method_calls']):
-                g.tracking['method_calls'][controller_log_index]['duration_ms'] = round(duration_ms, 2)
-                # Capture the actual return value for controller methods
-                # For HTML responses (strings), store the full content for devPanel display
-                # The devPanel will strip HTML comments on the client side
-                if isinstance(result, str):
-                    g.tracking['method_calls'][controller_log_index]['return_value'] = result
-                    g.tracking['method_calls'][controller_log_index]['is_html_response'] = True
-                    # Include template path if available
-                    if hasattr(g, 'tracking') and g.tracking.get('template_path'):
-                        g.tracking['method_calls'][controller_log_index]['template_path'] = g.tracking['template_path']
-                else:
-                    # For non-string responses (redirects, Response objects), use placeholder
-                    g.tracking['method_calls'][controller_log_index]['return_value'] = '[Response Object]'
-        else:
-            # Prepare return value for logging (truncate if too large)
-            logged_return_value = _truncate_value(result)
+        # Return the original result (not the truncated version)
+        return result
+
+    return wrapper
+
+
+def _wrap_instance(func: Callable, func_name: str) -> Callable:
+    """
+    @log_method_call wrapper for instance methods (def method(self, ...)).
+
+    Same as _wrap_static(), except the name comes from the class of args[0]
+    ('self' - may be a subclass) and 'self' isn't logged as an argument.
+    """
+    # "ClassName.method" per concrete class, built on first use
+    # (a subclass calling an inherited method gets its own entry)
+    instance_names = {}
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        if not has_app_context():
+            return func(*args, **kwargs)
+        if g.get('controller_name', 'Unknown') == 'Unknown':
+            _note_controller_name(func_name)
+
+        cls = args[0].__class__
+        method_name = instance_names.get(cls)
+        if method_name is None:
+            method_name = instance_names[cls] = sys.intern(f"{cls.__name__}.{func_name}")
+        logged_args = args[1:]  # Remove 'self' from args
 
-            # Log the successful call for non-controller methods
+        start_time = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            end_time = time.perf_counter()
             _log_method_call(
                 method_name=method_name,
                 args=_sanitize_args(logged_args),
                 kwargs=_sanitize_kwargs(kwargs),
-                return_value=logged_return_value,
-                duration_ms=round(duration_ms, 2),
+                return_value=None,
+                duration_ms=(end_time - start_time) * 1000,
+                exception=str(e),
+                clock=end_time
+            )
+            raise
+
+        end_time = time.perf_counter()
+        _log_method_call(
+            method_name=method_name,
+            args=_sanitize_args(logged_args),
+            kwargs=_sanitize_kwargs(kwargs),
+            return_value=_truncate_value(result),
+            duration_ms=(end_time - start_time) * 1000,
+            exception=None,
+            clock=end_time
+        )
+        return result
+
+    return wrapper
+
+
+def _wrap_controller(func: Callable, func_name: str) -> Callable:
+    """
+    @log_method_call wrapper for controller methods (Flask route handlers).
+
+    Controllers are logged under request.endpoint (e.g., "users.create",
+    "tasks.index"), and their entry is written BEFORE the handler runs -
+    see below - then filled in with duration and response when it returns.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs) -> Any:
+        if not has_app_context():
+            return func(*args, **kwargs)
+        if g.get('controller_name', 'Unknown') == 'Unknown':
+            _note_controller_name(func_name)
+
+        # Use request.endpoint for qualified name (e.g., "users.create", "tasks.index")
+        # This makes controller methods show up properly in the Method Calls list
+        try:
+            method_name = request.endpoint or func_name
+        except RuntimeError:
+            method_name = func_name
+
+        # Log at the START of execution
+        # This is critical because success_response() captures tracking data before
+        # the controller method finishes, so we need to log before calling the function
+        # We'll store the log entry index to update duration after execution
+        # ✅ DO: Keep the tracking dict we looked up here - the updates below reuse it
+        controller_log_index = None
+        if 'tracking' in g:
+            tracking = g.tracking
+            # (method_calls is column-based: one list per field, see init_request_tracking)
+            calls = tracking['method_calls']
+            controller_log_index = len(calls['method_name'])
+            _log_method_call(
+                method_name=method_name,
+                args=_sanitize_args(args),
+                kwargs=_sanitize_kwargs(kwargs),
+                return_value='[pending]',
+                duration_ms=0,
                 exception=None
             )
 
-        # Return the original result (not the truncated version)
+        start_time = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            duration_ms = (time.perf_counter() - start_time) * 1000
+
+            # Update the existing log entry
+            if controller_log_index is not None and controller_log_index < len(calls['method_name']):
+                calls['duration_ms'][controller_log_index] = duration_ms
+                calls['exception'][controller_log_index] = str(e)
+                calls['return_value'][controller_log_index] = None
+            raise
+
+        duration_ms = (time.perf_counter() - start_time) * 1000
+
+        # Update the existing log entry with final data
+        if controller_log_index is not None and controller_log_index < len(calls['method_name']):
+            calls['duration_ms'][controller_log_index] = duration_ms
+            # Capture the actual return value for controller methods
+            # For HTML responses (strings), store the full content for devPanel display
+            # The devPanel will strip HTML comments on the client side
+            if isinstance(result, str):
+                calls['return_value'][controller_log_index] = result
+                calls['is_html_response'][controller_log_index] = True
+                # Include template path if available
+                if tracking.get('template_path'):
+                    calls['template_path'][controller_log_index] = tracking['template_path']
+            else:
+                # For non-string responses (redirects, Response objects), use placeholder
+                calls['return_value'][controller_log_index] = '[Response Object]'
+
         return result
 
     return wrapper
 
 
 def _log_method_call(method_name: str, args: list, kwargs: dict,
-                     return_value: Any, duration_ms: float, exception: str = None) -> None:
+                     return_value: Any, duration_ms: float, exception: str = None,
+                     clock: float = None) -> None:
     """
     Internal helper to log method call to Flask's request-scoped tracking.
 
@@ -239,33 +409,15 @@ def _log_method_call(method_name: str, args: list, kwargs: dict,
         return_value: What the method returned (already truncated)
         duration_ms: How long the method took to execute
         exception: Exception message if one occurred, None otherwise
+        clock: time.perf_counter() reading for the log timestamp (None = read the clock now)
     """
-    try:
-        from flask import g
-    except RuntimeError:
-        # Not in Flask request context - skip logging
-        return
-
-    # Don't log if tracking not initialized (shouldn't happen, but be safe)
-    if not hasattr(g, 'tracking'):
+    # Not in a Flask context, or tracking not initialized (shouldn't happen, but be safe)
+    # (g is imported once at the top of this module)
+    if not has_app_context() or 'tracking' not in g:
         return
 
-    # Create log entry
-    call_entry = {
-        'method_name': method_name,
-        'args': args,
-        'kwargs': kwargs,
-        'return_value': return_value,
-        'duration_ms': duration_ms,
-        'timestamp': time.time(),
-    }
-
-    # Add exception info if one occurred
-    if exception:
-        call_entry['exception'] = exception
-
-    # Add to tracking list
-    g.tracking['method_calls'].append(call_entry)
+    # Add to tracking columns (one value per field - no dict per call)
+    append_method_call(method_name, args, kwargs, return_value, duration_ms, exception, clock)
 
 
 def _truncate_value(value: Any, max_length: int = 1000) -> Any:
@@ -296,7 +448,14 @@ def _truncate_value(value: Any, max_length: int = 1000) -> Any:
     """
     try:
         # Try to get string representation
-        str_value = str(value)
+        # Long lists (e.g. Task.get_all() rows) only get as much of it built as
+        # can be shown - not a 50 KB string that is cut to 1000 chars anyway
+        if isinstance(value, (list, tuple, dict)) and len(value) > _SMALL_CONTAINER_LEN:
+            str_value = _str_prefix(value, max_length)
+            if str_value is None:
+                return value  # All of it fits after all
+        else:
+            str_value = str(value)
 
         # If it's small enough, return the original value
         if len(str_value) <= max_length:
@@ -311,6 +470,35 @@ def _truncate_value(value: Any, max_length: int = 1000) -> Any:
         return value
 
 
+def _str_prefix(value: Any, max_length: int) -> Any:
+    """
+    Build the start of str(value) for a list, tuple or dict - just past max_length.
+
+    Items are converted one at a time (repr, as str() of a container does) and
+    we stop once the text is longer than max_length, so the result matches
+    str(value) as far as _truncate_value() will use it.
+
+    Returns:
+        The prefix string, or None if the whole of str(value) fits in max_length
+    """
+    if isinstance(value, dict):
+        opening, closing = '{', '}'
+        items = (f'{key!r}: {item!r}' for key, item in value.items())
+    else:
+        opening, closing = ('[', ']') if isinstance(value, list) else ('(', ')')
+        items = map(repr, value)
+
+    parts = []
+    length = len(opening) + len(closing)
+    for text in items:
+        # 2 = the ", " separator
+        length += len(text) + (2 if parts else 0)
+        parts.append(text)
+        if length > max_length:
+            return opening + ', '.join(parts)
+    return None
+
+
 def _sanitize_args(args: tuple) -> list:
     """
     Convert args tuple to list and make safe for JSON serialization.
@@ -329,16 +517,21 @@ def _sanitize_args(args: tuple) -> list:
     - Generally we want to show arguments for debugging
     - But we should filter out sensitive data (passwords, tokens)
     - For now, we just convert to strings (future: add sensitive field list)
+    - Fast path: the usual arguments (IDs, form strings) are all primitives,
+      so they're copied in one go without the per-item loop below
     """
+    if all(type(arg) in _PRIM_SET for arg in args):
+        return list(args)
+
     sanitized = []
     for arg in args:
         if isinstance(arg, (str, int, float, bool, type(None))):
             # These are already JSON-serializable
             sanitized.append(arg)
         else:
-            # Convert to string representation
+            # Convert to a short string representation
             # Future enhancement: check if field is sensitive data
-            sanitized.append(str(arg)[:100])  # Limit string length
+            sanitized.append(_ARG_REPR.repr(arg))
 
     return sanitized
 
@@ -360,15 +553,19 @@ def _sanitize_kwargs(kwargs: dict) -> dict:
     - Generally we want to show kwargs for debugging
     - But we should filter out sensitive data (passwords, tokens)
     - For now, we just convert to strings (future: add sensitive field list)
+    - Fast path: all-primitive values (the common case) are copied in one go
     """
+    if all(type(value) in _PRIM_SET for value in kwargs.values()):
+        return dict(kwargs)
+
     sanitized = {}
     for key, value in kwargs.items():
         if isinstance(value, (str, int, float, bool, type(None))):
             # These are already JSON-serializable
             sanitized[key] = value
         else:
-            # Convert to string representation
+            # Convert to a short string representation
             # Future enhancement: check if field is sensitive data
-            sanitized[key] = str(value)[:100]  # Limit string length
+            sanitized[key] = _ARG_REPR.repr(value)
 
     return sanitized
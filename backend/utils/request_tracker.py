@@ -28,12 +28,19 @@ Important:
 - All sensitive data is removed before injection (never expose secrets)
 """
 
+import os
+import sys
 import uuid
 import json
 import time
-import copy
 from flask import g, request, after_this_request, render_template as flask_render_template
-from functools import wraps
+
+# orjson (optional C extension) encodes the dev panel data several times faster
+# than the json module - used when installed, json otherwise
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 # ============================================================================
@@ -41,13 +48,50 @@ from functools import wraps
 # ============================================================================
 # This is the structure we store in flask.g.tracking during each request
 
+# method_calls and db_queries are stored as columns: one list per field,
+# where index i of every list belongs to the i-th call/query.
+# ✅ DO: Append a value to each column instead of building a dict per call
+#    (a request can log hundreds of calls - that's hundreds of dicts saved)
+# The dev panel still gets one dict per call - see columns_to_rows()
+METHOD_CALL_COLUMNS = (
+    'method_name', 'args', 'kwargs', 'return_value', 'duration_ms', 'timestamp',
+    'exception', 'is_html_response', 'template_path'
+)
+DB_QUERY_COLUMNS = ('query', 'params', 'result_row_count', 'duration_ms', 'timestamp')
+
+# Columns left out of a call's dict when they hold None (most calls don't have them)
+_OPTIONAL_COLUMNS = frozenset({'exception', 'is_html_response', 'template_path'})
+
+# Most method calls / DB queries kept per request (each list separately)
+# A runaway loop (e.g. an N+1 page over thousands of rows) would otherwise
+# put megabytes of log into every response. Entries past the limit are
+# counted, not stored, and __DEBUG__ ends with one "... N more" entry.
+# ✅ DO: Keep the FIRST entries - the controller's own entry is always first
+MAX_TRACKED_ENTRIES = int(os.environ.get('TRACKING_MAX_ENTRIES', '500'))
+
+# HTML responses bigger than this don't get __DEBUG__ (see after_request)
+MAX_INJECT_BYTES = 2 * 1024 * 1024
+
+# Request headers shown in the Network Inspector
+# ⚠️ DON'T: Show Cookie/Authorization - __DEBUG__ is embedded in the page itself
+_SAFE_HEADERS = frozenset({
+    'Host', 'Accept', 'Accept-Language', 'Content-Type', 'Content-Length',
+    'Origin', 'Referer', 'User-Agent', 'X-Requested-With'
+})
+
+# Placeholder in base.html where after_request() puts the __DEBUG__ script
+DEBUG_SLOT_MARKER = b'<!--__DEBUG_SLOT__-->'
+# The slot sits right before </body>, so it (and </body>) is looked for in the page's tail only
+DEBUG_SLOT_SEARCH_BYTES = 4096
+
 def init_request_tracking():
     """
     Initialize the tracking data structure for a new request.
 
     Stored in flask.g.tracking which is request-scoped (unique per request).
 
-    Structure:
+    Structure (method_calls and db_queries shown as the rows they turn into -
+    they are stored as columns, see METHOD_CALL_COLUMNS):
     {
         'method_calls': [
             {
@@ -89,14 +133,10 @@ def init_request_tracking():
             'db_start': None,
             'db_end': None
         },
-        'view_data': {
-            'users': [...],
-            'tasks': [...]
-        },
+        'view_data_json': '{"users": [...], "tasks": [...]}',
         'request_info': {
             'method': 'GET',
             'url': '/tasks',
-            'headers': {...},
             'status': 200,
             'controller': 'TaskController.index',
             'content_type': 'text/html'
@@ -104,19 +144,169 @@ def init_request_tracking():
     }
     """
     return {
-        'method_calls': [],
-        'db_queries': [],
+        'method_calls': {column: [] for column in METHOD_CALL_COLUMNS},
+        'db_queries': {column: [] for column in DB_QUERY_COLUMNS},
+        'method_calls_dropped': 0,  # Calls/queries past MAX_TRACKED_ENTRIES
+        'db_queries_dropped': 0,
         'errors': [],
         'timing': {
             'request_start': time.time(),
             'request_end': None
         },
-        'view_data': {},
+        # perf_counter() reading taken with request_start - converts perf_counter
+        # values to wall-clock timestamps (see append_method_call)
+        'perf_start': time.perf_counter(),
+        'view_data_json': '{}',  # Serialized once by track_view_data()
         'request_info': {},
         'template_path': None  # Stores the template path when using tracked_render_template
     }
 
 
+def _safe_default(obj):
+    """
+    Encoder fallback for objects JSON can't represent (dates, Rows, ...).
+
+    Returns a short repr() so the dev panel still shows *something* useful.
+    """
+    return repr(obj)[:200]
+
+
+def _dumps(obj):
+    """
+    Serialize tracking data to a JSON string - with orjson when available.
+
+    Both paths fall back to _safe_default() for unknown objects. Raises
+    TypeError/ValueError for data JSON can't hold (e.g. circular references).
+    """
+    if orjson is not None:
+        # OPT_NON_STR_KEYS: allow int keys like json.dumps does ({1: ...} -> {"1": ...})
+        return orjson.dumps(obj, default=_safe_default, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, default=_safe_default)
+
+
+def columns_to_rows(columns):
+    """
+    Turn column-stored tracking data back into a list of dicts (one per entry).
+
+    Done once, when __DEBUG__ is built - the dev panel expects
+    [{'method_name': ..., 'args': ...}, ...]. Optional fields that are None
+    (e.g. 'exception' for a call that didn't raise) are left out.
+
+    Example:
+        >>> columns_to_rows({'query': ['SELECT 1', 'SELECT 2'], 'params': [[], [5]]})
+        [{'query': 'SELECT 1', 'params': []}, {'query': 'SELECT 2', 'params': [5]}]
+    """
+    names = tuple(columns)
+    return [
+        {
+            name: value
+            for name, value in zip(names, row)
+            if value is not None or name not in _OPTIONAL_COLUMNS
+        }
+        for row in zip(*columns.values())
+    ]
+
+
+def get_method_calls():
+    """
+    Return this request's method calls as a list of dicts, for __DEBUG__.
+
+    If calls were dropped (MAX_TRACKED_ENTRIES), a last entry says how many.
+    """
+    tracking = g.tracking
+    rows = columns_to_rows(tracking['method_calls'])
+    dropped = tracking.get('method_calls_dropped', 0)
+    if dropped:
+        rows.append({
+            'method_name': f'... {dropped} more calls not logged (limit: {MAX_TRACKED_ENTRIES})',
+            'args': [],
+            'kwargs': {},
+            'return_value': None,
+            'duration_ms': 0,
+            'timestamp': time.time()
+        })
+    return rows
+
+
+def get_db_queries():
+    """
+    Return this request's database queries as a list of dicts, for __DEBUG__.
+
+    If queries were dropped (MAX_TRACKED_ENTRIES), a last entry says how many.
+    """
+    tracking = g.tracking
+    rows = columns_to_rows(tracking['db_queries'])
+    dropped = tracking.get('db_queries_dropped', 0)
+    if dropped:
+        rows.append({
+            'query': f'-- ... {dropped} more queries not logged (limit: {MAX_TRACKED_ENTRIES})',
+            'params': [],
+            'result_row_count': 0,
+            'duration_ms': 0,
+            'timestamp': time.time()
+        })
+    return rows
+
+
+def append_method_call(method_name, args, kwargs, return_value, duration_ms,
+                       exception=None, clock=None):
+    """
+    Append one method call to g.tracking['method_calls'] (one value per column).
+
+    Shared by track_method_call() and the @log_method_call decorator.
+    Call only when g.tracking exists.
+
+    clock: a time.perf_counter() reading the caller already has (the decorator
+    times every call with it). The timestamp is then worked out from the
+    request's start time instead of reading the system clock again.
+    """
+    tracking = g.tracking
+    calls = tracking['method_calls']
+    if len(calls['method_name']) >= MAX_TRACKED_ENTRIES:
+        tracking['method_calls_dropped'] += 1
+        return
+
+    if clock is None:
+        timestamp = time.time()
+    else:
+        timestamp = tracking['timing']['request_start'] + (clock - tracking['perf_start'])
+
+    calls['method_name'].append(method_name)
+    calls['args'].append(args)
+    calls['kwargs'].append(kwargs)
+    calls['return_value'].append(return_value)
+    calls['duration_ms'].append(duration_ms)
+    calls['timestamp'].append(timestamp)
+    calls['exception'].append(exception or None)
+    calls['is_html_response'].append(None)
+    calls['template_path'].append(None)
+
+
+def get_request_info():
+    """
+    Return this request's request_info for __DEBUG__, with its headers.
+
+    Headers are read from the request only here, when __DEBUG__ is built -
+    not copied for every request in before_request() - and only the
+    _SAFE_HEADERS are included (no cookies or credentials in the page).
+    """
+    info = dict(g.tracking.get('request_info', {}))
+    info['headers'] = {key: value for key, value in request.headers.items() if key in _SAFE_HEADERS}
+    return info
+
+
+def get_view_data():
+    """
+    Return the view data tracked for this request, as plain JSON-style data.
+
+    track_view_data() stores a JSON snapshot rather than the live objects,
+    so this decodes it - used when __DEBUG__ is embedded in a JSON response.
+    """
+    if not hasattr(g, 'tracking'):
+        return {}
+    return json.loads(g.tracking.get('view_data_json') or '{}')
+
+
 # ============================================================================
 # FLASK MIDDLEWARE FUNCTIONS
 # ============================================================================
@@ -153,8 +343,8 @@ def before_request():
         'request_id': g.request_id,
         'method': request.method,
         'url': request.path,
-        'timestamp': time.time(),
-        'headers': dict(request.headers)
+        'timestamp': time.time()
+        # 'headers' is added only when __DEBUG__ is built - see get_request_info()
     }
 
     # Log the request start for developer panel
@@ -201,36 +391,65 @@ def after_request(response):
         g.tracking['request_info']['controller'] = g.controller_name
 
     # Inject debug object into HTML responses
-    if response.content_type and 'text/html' in response.content_type:
+    # HTMX swaps (HX-Request header) are page fragments - the full page they
+    # land in already has its own __DEBUG__, so don't even read their body
+    if response.content_type and 'text/html' in response.content_type and \
+            not request.headers.get('HX-Request'):
+        # Streamed/file responses would have to be read fully into memory to
+        # find </body> - and a multi-MB page gains nothing from the dev panel
+        if response.direct_passthrough or response.is_streamed or \
+                (response.content_length or 0) > MAX_INJECT_BYTES:
+            return response
+
         try:
-            # Get the response HTML as string
-            response_html = response.get_data(as_text=True)
+            # Work on the raw response bytes - no decoding the page to str and back
+            # base.html puts DEBUG_SLOT_MARKER just before </body>, so only the
+            # last few KB of the page are searched for it
+            # Pages not built on base.html: fall back to the last </body> (also
+            # only in the tail - a fragment with no </body> there isn't a full page)
+            # ✅ DO: Skip building the debug JSON if there's nowhere to put it
+            response_bytes = response.get_data()
+            tail_start = max(0, len(response_bytes) - DEBUG_SLOT_SEARCH_BYTES)
+            slot_start = response_bytes.rfind(DEBUG_SLOT_MARKER, tail_start)
+            if slot_start != -1:
+                slot_end = slot_start + len(DEBUG_SLOT_MARKER)  # Marker is replaced
+            else:
+                slot_start = slot_end = response_bytes.rfind(b'</body>', tail_start)  # Insert only
+                if slot_start == -1:
+                    return response
 
             # Create the debug object with all tracking data
+            # (view_data is left out - it was serialized already, see below)
             debug_object = {
                 'request_id': g.request_id,
-                'method_calls': g.tracking['method_calls'],
-                'db_queries': g.tracking['db_queries'],
+                'method_calls': get_method_calls(),
+                'db_queries': get_db_queries(),
                 'errors': g.tracking['errors'],
                 'timing': g.tracking['timing'],
-                'view_data': g.tracking['view_data'],
-                'request_info': g.tracking.get('request_info', {}),
+                'request_info': get_request_info(),
                 'template_path': g.tracking.get('template_path')
             }
 
-            # Convert to JSON (safe for HTML context)
+            # Convert to JSON, then splice in the view data JSON from track_view_data()
+            # ✅ DO: Reuse already-serialized fragments instead of encoding them twice
+            # debug_object is never empty, so its JSON always ends with "}"
+            debug_json = _dumps(debug_object)
+            view_data_json = g.tracking.get('view_data_json') or '{}'
+            debug_json = f'{debug_json[:-1]}, "view_data": {view_data_json}}}'
+
+            # Make it safe for HTML context
             # We must escape </ sequences to prevent breaking out of script context
             # e.g., </script> in HTML content would close the script tag prematurely
-            debug_json = json.dumps(debug_object).replace('</', '<\\/')
+            debug_json = debug_json.replace('</', '<\\/')
 
             # Inject before </body> tag
             # Using <script> to define window.__DEBUG__ for JavaScript access
-            debug_script = f'<script>window.__DEBUG__ = {debug_json};</script>'
+            debug_script = f'<script>window.__DEBUG__ = {debug_json};</script>'.encode('utf-8')
 
-            # Find closing body tag and insert before it
-            if '</body>' in response_html:
-                modified_html = response_html.replace('</body>', f'{debug_script}</body>')
-                response.set_data(modified_html)
+            # Put the script in the slot (one copy of the page, not several)
+            modified_html = bytearray(response_bytes)
+            modified_html[slot_start:slot_end] = debug_script
+            response.set_data(bytes(modified_html))
 
         except Exception as e:
             # If something goes wrong, don't break the response
@@ -248,7 +467,8 @@ def track_method_call(method_name, args=None, kwargs=None, return_value=None, du
     """
     Log a method invocation to the request's tracking data.
 
-    Called by @log_method_call decorator (automatically).
+    For logging a call by hand - the @log_method_call decorator
+    (backend.utils.decorators) appends through append_method_call() directly.
 
     Args:
         method_name (str): Name of method called (e.g., 'User.validate')
@@ -257,7 +477,7 @@ def track_method_call(method_name, args=None, kwargs=None, return_value=None, du
         return_value: What the method returned
         duration_ms (float): How long the method took to execute
 
-    Stored in g.tracking['method_calls'] as ordered list.
+    Stored in g.tracking['method_calls'] (one column per field, in call order).
 
     Dev Panel use:
     - Displays as tree/stack of all method calls
@@ -279,18 +499,8 @@ def track_method_call(method_name, args=None, kwargs=None, return_value=None, du
     if not hasattr(g, 'tracking'):
         return
 
-    # Create entry
-    call_entry = {
-        'method_name': method_name,
-        'args': args or [],
-        'kwargs': kwargs or {},
-        'return_value': return_value,
-        'duration_ms': duration_ms,
-        'timestamp': time.time()
-    }
-
-    # Add to tracking
-    g.tracking['method_calls'].append(call_entry)
+    # Add to tracking (one value per column)
+    append_method_call(method_name, args or [], kwargs or {}, return_value, duration_ms)
 
 
 def track_db_query(query, params=None, result_row_count=0, duration_ms=0):
@@ -305,7 +515,7 @@ def track_db_query(query, params=None, result_row_count=0, duration_ms=0):
         result_row_count (int): Number of rows returned/affected
         duration_ms (float): How long the query took to execute
 
-    Stored in g.tracking['db_queries'] as ordered list.
+    Stored in g.tracking['db_queries'] (one column per field, in query order).
 
     Dev Panel use:
     - Displays in Database Inspector tab
@@ -327,17 +537,20 @@ def track_db_query(query, params=None, result_row_count=0, duration_ms=0):
     if not hasattr(g, 'tracking'):
         return
 
-    # Create entry
-    query_entry = {
-        'query': query,
-        'params': params or [],
-        'result_row_count': result_row_count,
-        'duration_ms': duration_ms,
-        'timestamp': time.time()
-    }
+    # Past the limit: only count it
+    queries = g.tracking['db_queries']
+    if len(queries['query']) >= MAX_TRACKED_ENTRIES:
+        g.tracking['db_queries_dropped'] += 1
+        return
 
-    # Add to tracking
-    g.tracking['db_queries'].append(query_entry)
+    # Add to tracking (one value per column)
+    # sys.intern: the same SQL text logged many times is stored once
+    # (queries built per call, like "... IN (?, ?, ?)", are new strings each time)
+    queries['query'].append(sys.intern(query))
+    queries['params'].append(params or [])
+    queries['result_row_count'].append(result_row_count)
+    queries['duration_ms'].append(duration_ms)
+    queries['timestamp'].append(time.time())
 
 
 def track_error(error_type, message, raw_error, query=None, params=None):
@@ -401,7 +614,7 @@ def track_view_data(data):
         data (dict): Data dictionary passed to render_template()
                     (e.g., {'users': [...], 'current_user': {...}})
 
-    Stored in g.tracking['view_data'].
+    Stored in g.tracking['view_data_json'] (already serialized to JSON).
 
     Dev Panel use:
     - Displays in State Inspector tab
@@ -416,7 +629,9 @@ def track_view_data(data):
     - Shows what information is available to the template to render
 
     Important Implementation Details:
-    - Uses deep copy to avoid mutations of original data
+    - Serializes to JSON right away - a snapshot, so later mutations of the
+      original data don't change what the dev panel shows (no deep copy needed)
+    - Objects JSON can't represent are shown as a short repr()
     - Handles circular references gracefully (converts to string representation)
     - Never exposes sensitive data like passwords
     - Filters out Flask-specific objects that can't be serialized
@@ -435,18 +650,17 @@ def track_view_data(data):
     if not hasattr(g, 'tracking'):
         return
 
-    # Store view data with deep copy to avoid mutations
-    # Deep copy ensures that changes to the original data after rendering
-    # won't affect what the dev panel shows
+    # Snapshot the view data as JSON now
+    # One serialization both copies the data (later changes don't show up) and
+    # does the serialization after_request() would otherwise do again
+    # ✅ DO: Serialize once instead of deep-copying and then serializing
     try:
-        # Try to deep copy the data to avoid reference issues
-        # This is important because templates might modify data during rendering
-        g.tracking['view_data'] = copy.deepcopy(data)
+        g.tracking['view_data_json'] = _dumps(data)
     except (TypeError, ValueError):
-        # If deep copy fails (circular references, non-serializable objects),
-        # store the data as-is and let JSON serialization in after_request handle it
-        # The after_request will catch any serialization errors gracefully
-        g.tracking['view_data'] = data
+        # Circular references or unusual keys - fall back to one repr() per variable
+        g.tracking['view_data_json'] = _dumps(
+            {str(key): _safe_default(value) for key, value in data.items()}
+        )
 
 
 def tracked_render_template(template_name, **context):
@@ -498,86 +712,6 @@ def tracked_render_template(template_name, **context):
     return flask_render_template(template_name, **context)
 
 
-# ============================================================================
-# DECORATOR FOR AUTOMATIC METHOD LOGGING
-# ============================================================================
-
-def log_method_call(func):
-    """
-    Decorator: Automatically log method calls with arguments, return value, and duration.
-
-    Usage:
-    @log_method_call
-    def my_method(arg1, arg2):
-        return result
-
-    What it does:
-    1. Records method name
-    2. Captures all arguments (args and kwargs)
-    3. Executes the method and times it
-    4. Captures return value
-    5. Logs everything to g.tracking['method_calls']
-
-    Why a decorator?
-    - Automatic logging without modifying method code
-    - Consistent across all models and controllers
-    - Can be toggled on/off easily
-    - Separates logging concern from business logic
-
-    Dev Panel use:
-    - Decorator enables Method Call Stack tab
-    - Shows complete call tree during request
-    - Developers can see exactly what methods were called and when
-    - Makes MVC flow visible and debuggable
-
-    Lesson coverage:
-    - Lesson 2: Introduces method logging
-    - Lesson 3: Shows Model methods being logged
-    - Lesson 5: Shows Controller methods being logged
-
-    Example log entry:
-    method_name: 'User.validate'
-    args: []
-    kwargs: {'email': 'alice@example.com'}
-    return_value: True
-    duration_ms: 2.5
-    """
-    @wraps(func)
-    def wrapper(*args, **kwargs):
-        # Extract class name if this is a method
-        # (args[0] is 'self' for instance methods)
-        if args and hasattr(args[0], '__class__'):
-            class_name = args[0].__class__.__name__
-            method_name = f"{class_name}.{func.__name__}"
-            # Remove 'self' from args for logging
-            logged_args = args[1:]
-        else:
-            method_name = func.__name__
-            logged_args = args
-
-        # Record start time
-        start_time = time.time()
-
-        # Call the actual method
-        result = func(*args, **kwargs)
-
-        # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
-
-        # Log the call
-        track_method_call(
-            method_name=method_name,
-            args=list(logged_args),
-            kwargs=kwargs,
-            return_value=result,
-            duration_ms=round(duration_ms, 2)
-        )
-
-        return result
-
-    return wrapper
-
-
 # ============================================================================
 # INITIALIZATION FUNCTION FOR FLASK APP
 # ============================================================================
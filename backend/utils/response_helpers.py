@@ -19,8 +19,115 @@ Design Notes:
 - __DEBUG__ embedded directly in JSON response (no separate requests)
 """
 
-from flask import jsonify, request, g
+import json
+from flask import current_app, jsonify, request, g, stream_with_context
 from typing import Any, Dict, Optional, Tuple
+from backend.utils.request_tracker import (
+    get_db_queries, get_method_calls, get_request_info, get_view_data
+)
+
+# orjson (optional C extension) encodes the __DEBUG__-heavy JSON responses
+# several times faster than jsonify's json module - used when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# JSON responses logging more method calls than this are streamed (see _json_response)
+STREAM_DEBUG_THRESHOLD = 200
+
+
+def _encode(obj: Any) -> bytes:
+    """Encode one value as JSON bytes (orjson if available), like jsonify would."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, default=str, sort_keys=True).encode('utf-8')
+
+
+def _stream_json(response_data: Dict[str, Any]):
+    """
+    Yield response_data as JSON, encoding __DEBUG__.method_calls one call at a time.
+
+    The client starts receiving the response while the (long) call list is
+    still being encoded, and the whole encoded body is never held in memory.
+    """
+    debug = dict(response_data['__DEBUG__'])
+    method_calls = debug.pop('method_calls')
+    head = {key: value for key, value in response_data.items() if key != '__DEBUG__'}
+
+    # Both dicts are non-empty, so their JSON ends with "}" - reopen them
+    yield _encode(head)[:-1] + b',"__DEBUG__":' + _encode(debug)[:-1] + b',"method_calls":['
+    for index, call in enumerate(method_calls):
+        yield (b',' if index else b'') + _encode(call)
+    yield b']}}'
+
+
+def _json_response(response_data: Dict[str, Any], status: int) -> Tuple[Any, int]:
+    """
+    Build the (JSON response, status) pair returned by the helpers below.
+
+    Same output as jsonify() - sorted keys, str() for values like Decimal or
+    UUID - but encoded by orjson when it's available.
+
+    Responses with a long __DEBUG__ method call list (more than
+    STREAM_DEBUG_THRESHOLD calls) are streamed instead of built in one piece.
+    """
+    method_calls = response_data.get('__DEBUG__', {}).get('method_calls', ())
+    if len(method_calls) > STREAM_DEBUG_THRESHOLD:
+        stream = stream_with_context(_stream_json(response_data))
+        return current_app.response_class(stream, mimetype='application/json'), status
+
+    if orjson is None:
+        return jsonify(response_data), status
+
+    return current_app.response_class(_encode(response_data), mimetype='application/json'), status
+
+
+def _wants_debug() -> bool:
+    """
+    Should this JSON response carry __DEBUG__?
+
+    The dev panel's client (MvcApi in mvc-api.js) opts in with an
+    "X-Debug: 1" header; in debug mode every JSON response gets it.
+    Other API clients don't pay for building and sending the tracking data.
+    """
+    return request.headers.get('X-Debug') == '1' or current_app.debug
+
+
+def _build_debug() -> Optional[Dict[str, Any]]:
+    """
+    Assemble the __DEBUG__ object embedded in JSON responses.
+
+    Empty sections (no queries, no errors, no view data...) are left out
+    rather than sent as [] or {} - the dev panel treats a missing section
+    as empty, and most JSON responses have several of them.
+
+    Returns:
+        The __DEBUG__ dict, or None if this request isn't being tracked
+        or the client didn't ask for it (see _wants_debug)
+    """
+    if not _wants_debug():
+        return None
+
+    # Look each up on g once and keep it in a local
+    tracking = g.get('tracking')
+    request_id = g.get('request_id')
+    if tracking is None or request_id is None:
+        return None
+
+    debug = {'request_id': request_id, 'timing': tracking['timing']}
+    sections = (
+        ('method_calls', get_method_calls()),
+        ('db_queries', get_db_queries()),
+        ('errors', tracking.get('errors')),
+        ('view_data', get_view_data()),
+        ('request_info', get_request_info()),
+    )
+    for key, value in sections:
+        if value:
+            debug[key] = value
+    return debug
 
 
 def wants_json() -> bool:
@@ -28,7 +135,7 @@ def wants_json() -> bool:
     Determine if the client wants a JSON response.
 
     Checks multiple indicators:
-    1. Accept header contains 'application/json'
+    1. Accept header prefers 'application/json' over 'text/html'
     2. Query parameter ?format=json
     3. X-Requested-With header (indicates fetch/XHR request)
 
@@ -45,10 +152,26 @@ def wants_json() -> bool:
     Educational Note:
     This demonstrates content negotiation - the same endpoint can serve
     multiple formats based on client preference.
+
+    The answer can't change during a request, so it's worked out once and
+    kept on g - controllers call this several times per request.
     """
+    cached = g.get('_wants_json')
+    if cached is not None:
+        return cached
+    g._wants_json = result = _client_wants_json()
+    return result
+
+
+def _client_wants_json() -> bool:
+    """Inspect the request headers/args for wants_json() (uncached)."""
     # Check Accept header (standard HTTP way to request JSON)
-    accept = request.headers.get('Accept', '')
-    if 'application/json' in accept:
+    # ✅ DO: Compare the q-values Werkzeug parsed for us - JSON must be
+    #        preferred over HTML (browsers' "*/*;q=0.8" accepts both)
+    # ⚠️ DON'T: Substring-search the header - "application/json-patch+json; q=0"
+    #          contains 'application/json' but doesn't ask for it
+    accept = request.accept_mimetypes
+    if accept['application/json'] > accept['text/html']:
         return True
 
     # Check query parameter (explicit format request)
@@ -144,19 +267,12 @@ def success_response(
 
     # Embed __DEBUG__ object if tracking is available
     # (should always be available during normal request handling)
-    if hasattr(g, 'tracking') and hasattr(g, 'request_id'):
-        response_data['__DEBUG__'] = {
-            'request_id': g.request_id,
-            'method_calls': g.tracking['method_calls'],
-            'db_queries': g.tracking['db_queries'],
-            'errors': g.tracking.get('errors', []),
-            'timing': g.tracking['timing'],
-            'view_data': g.tracking.get('view_data', {}),
-            'request_info': g.tracking.get('request_info', {})
-        }
+    debug = _build_debug()
+    if debug is not None:
+        response_data['__DEBUG__'] = debug
 
     # Return JSON response with appropriate status code
-    return jsonify(response_data), status
+    return _json_response(response_data, status)
 
 
 def error_response(
@@ -238,16 +354,9 @@ def error_response(
 
     # Embed __DEBUG__ object if tracking is available
     # Even on errors, we want to see what the Model tried to do
-    if hasattr(g, 'tracking') and hasattr(g, 'request_id'):
-        response_data['__DEBUG__'] = {
-            'request_id': g.request_id,
-            'method_calls': g.tracking['method_calls'],
-            'db_queries': g.tracking['db_queries'],
-            'errors': g.tracking.get('errors', []),
-            'timing': g.tracking['timing'],
-            'view_data': g.tracking.get('view_data', {}),
-            'request_info': g.tracking.get('request_info', {})
-        }
+    debug = _build_debug()
+    if debug is not None:
+        response_data['__DEBUG__'] = debug
 
     # Return JSON response with appropriate error status code
-    return jsonify(response_data), status
+    return _json_response(response_data, status)
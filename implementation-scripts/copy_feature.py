@@ -16,6 +16,9 @@ Usage:
 
 """
 
+import argparse
+import bisect
+import functools
 import re
 import sys
 import os
@@ -26,6 +29,34 @@ from pathlib import Path
 IMPLEMENTATION_PLAN = "implementation"
 ENHANCEMENTS_PLAN = "enhancements"
 
+# Fixed section delimiters - found with str.find(), no regex needed
+_GENERAL_HEADER = "## Agent Guidelines & Best Practices\n\n"
+_GENERAL_END = "\n---\n"
+_STRUCTURE_HEADER = "## Project Structure\n\n"
+_STRUCTURE_END = "\n---"
+_TIME_MARKER = "**Time**: "
+_GOAL_MARKER = "**Goal**: "
+_PROMPT_HEADER = "**Agent Prompt**:\n```\n"
+_PROMPT_END = "\n```"
+
+# All regex patterns are compiled once at import - none depends on the
+# requested ID (lookups by ID go through _section_index)
+
+# IMPLEMENTATION_PLAN.md
+_FEATURE_HEADER_RE = re.compile(r"#### Feature (\d+\.\d+): (.*?)\n")
+_NEXT_FEATURE_RE = re.compile(r"#### Feature \d+\.\d+:|### Phase \d+:|## Summary")
+_FEATURE_FILES_RE = re.compile(r"\*\*Files to (?:create|modify)\*\*:\n((?:- `.*?\n)+)")
+
+# ENHANCEMENTS-PLAN.md
+_ENHANCEMENT_HEADER_RE = re.compile(r"### (\d+\.\d+) (.*?)\n")
+_NEXT_ENHANCEMENT_RE = re.compile(r"### \d+\.\d+|## Priority \d+:|## Implementation Order|## Technical Notes")
+_ENHANCEMENT_FILES_RE = re.compile(r"\*\*Files\*\*:\n((?:- .*?\n)+)")
+# One "Files" bullet: "- `path`", "- `path` - note" or "- free text"
+_FILE_LINE_RE = re.compile(r"-\s+(?:`([^`]+)`)?(.*)")
+_IMPLEMENTATION_RE = re.compile(r"\*\*Implementation\*\*:\n((?:- .*?\n)+)")
+_INVESTIGATION_RE = re.compile(r"\*\*Investigation(?:\sneeded)?\*\*:?\n((?:- .*?\n)+)")
+_CONTENT_OUTLINE_RE = re.compile(r"\*\*Content outline\*\*:\n((?:\d+\. .*?\n)+)")
+
 
 def get_plan_file(plan_type=IMPLEMENTATION_PLAN):
     """Get the path to the appropriate plan file"""
@@ -43,88 +74,153 @@ def get_plan_file(plan_type=IMPLEMENTATION_PLAN):
     return plan_file
 
 
+@functools.lru_cache(maxsize=2)
 def read_plan(plan_type=IMPLEMENTATION_PLAN):
-    """Read the entire plan file"""
+    """Read the entire plan file (once per plan type - the result is cached)"""
     plan_file = get_plan_file(plan_type)
-    with open(plan_file, 'r') as f:
-        return f.read()
+    # The plans contain non-ASCII (emoji, arrows) - decode explicitly rather
+    # than with the locale's default encoding
+    return plan_file.read_text(encoding='utf-8')
 
 
 def extract_general_principles(plan_type=IMPLEMENTATION_PLAN):
     """Extract Agent Guidelines & Best Practices section"""
-    plan = read_plan(plan_type)
-
-    # Find the section between "## Agent Guidelines & Best Practices" and the next section
-    pattern = r"## Agent Guidelines & Best Practices\n\n(.*?)\n---\n"
-    match = re.search(pattern, plan, re.DOTALL)
-
-    if match:
-        return match.group(1)
-    return None
+    return _context_sections(plan_type)[0]
 
 
 def extract_project_structure(plan_type=IMPLEMENTATION_PLAN):
     """Extract Project Structure section"""
+    return _context_sections(plan_type)[1]
+
+
+@functools.lru_cache(maxsize=2)
+def _context_sections(plan_type=IMPLEMENTATION_PLAN):
+    """
+    Return (general principles, project structure) for a plan.
+
+    Every extracted feature includes both, so they're located once per
+    plan type and reused.
+    """
     plan = read_plan(plan_type)
 
-    # Find the section between "## Project Structure" and the next major section
-    pattern = r"## Project Structure\n\n(.*?)\n---"
-    match = re.search(pattern, plan, re.DOTALL)
+    return (
+        # Between "## Agent Guidelines & Best Practices" and the next section
+        _find_section(plan, _GENERAL_HEADER, _GENERAL_END),
+        # Between "## Project Structure" and the next major section
+        _find_section(plan, _STRUCTURE_HEADER, _STRUCTURE_END),
+    )
 
-    if match:
-        return match.group(1)
-    return None
 
+def _line_field(text, marker, start=0):
+    """Return the rest of the line after marker (e.g. "**Time**: "), or None"""
+    pos = text.find(marker, start)
+    if pos < 0:
+        return None
+    pos += len(marker)
 
-def extract_implementation_feature(feature_id):
+    end = text.find('\n', pos)
+    if end < 0:
+        return None
+    return text[pos:end]
+
+
+def _parse_file_lines(files_text):
     """
-    Extract feature section from IMPLEMENTATION_PLAN.md.
-    Pattern: #### Feature X.Y: Title
+    Turn a "Files" bullet list into a list of entries.
+
+    The backticks around the path are removed, but the rest of the line is
+    kept - stripping backtick characters from both ends left a stray one
+    behind on lines like "- `path` - note".
     """
-    plan = read_plan(IMPLEMENTATION_PLAN)
+    files = []
+    for line in files_text.splitlines():
+        match = _FILE_LINE_RE.match(line.strip())
+        if match:
+            files.append(((match.group(1) or '') + match.group(2)).strip())
+    return files
 
-    # Escape dots in regex
-    escaped_id = feature_id.replace('.', r'\.')
 
-    # Pattern to match feature header
-    feature_pattern = rf"#### Feature {escaped_id}: (.*?)\n"
-    match = re.search(feature_pattern, plan)
+def _find_section(plan, header, end_marker):
+    """Return the text between header and the following end_marker, or None"""
+    start = plan.find(header)
+    if start < 0:
+        return None
+    start += len(header)
 
-    if not match:
+    end = plan.find(end_marker, start)
+    if end < 0:
         return None
+    return plan[start:end]
 
-    feature_title = match.group(1)
-    start_pos = match.start()
 
-    # Find the end of this feature (next feature or next phase)
-    next_feature_pattern = r"#### Feature \d+\.\d+:|### Phase \d+:|## Summary"
-    next_match = re.search(next_feature_pattern, plan[start_pos + 10:])
+@functools.lru_cache(maxsize=2)
+def _section_index(plan_type=IMPLEMENTATION_PLAN):
+    """
+    Map every feature/enhancement ID in a plan to (start, end, title).
 
-    if next_match:
-        end_pos = start_pos + 10 + next_match.start()
+    One pass over the plan finds all headers and all section boundaries;
+    extracting a feature is then a dict lookup and a slice.
+    """
+    plan = read_plan(plan_type)
+
+    if plan_type == ENHANCEMENTS_PLAN:
+        header_re, boundary_re = _ENHANCEMENT_HEADER_RE, _NEXT_ENHANCEMENT_RE
     else:
-        end_pos = len(plan)
+        header_re, boundary_re = _FEATURE_HEADER_RE, _NEXT_FEATURE_RE
+
+    boundaries = [match.start() for match in boundary_re.finditer(plan)]
+
+    index = {}
+    for match in header_re.finditer(plan):
+        start_pos = match.start()
+        # A section ends at the next boundary past its own header
+        i = bisect.bisect_left(boundaries, start_pos + 10)
+        end_pos = boundaries[i] if i < len(boundaries) else len(plan)
+        # First occurrence wins, like re.search() would
+        index.setdefault(match.group(1), (start_pos, end_pos, match.group(2)))
+
+    return index
+
+
+def extract_implementation_feature(feature_id, include_context=True):
+    """
+    Extract feature section from IMPLEMENTATION_PLAN.md.
+    Pattern: #### Feature X.Y: Title
+    """
+    plan = read_plan(IMPLEMENTATION_PLAN)
+
+    # Look up the feature's span (up to the next feature or next phase)
+    section = _section_index(IMPLEMENTATION_PLAN).get(feature_id)
+
+    if not section:
+        return None
 
+    start_pos, end_pos, feature_title = section
+    general_principles, project_structure = (
+        _context_sections(IMPLEMENTATION_PLAN) if include_context else (None, None)
+    )
     feature_section = plan[start_pos:end_pos]
 
     # Extract Time
-    time_match = re.search(r"\*\*Time\*\*: (.*?)\n", feature_section)
-    time = time_match.group(1) if time_match else "Unknown"
+    time = _line_field(feature_section, _TIME_MARKER)
+    if time is None:
+        time = "Unknown"
 
     # Extract Files to create/modify
-    files_section = re.search(r"\*\*Files to (?:create|modify)\*\*:\n((?:- `.*?\n)+)", feature_section)
+    files_section = _FEATURE_FILES_RE.search(feature_section)
     files = []
     if files_section:
         files_text = files_section.group(1)
-        files = [f.strip('- `').strip('`').strip() for f in files_text.split('\n') if f.strip()]
+        files = _parse_file_lines(files_text)
 
     # Extract Agent Prompt
-    prompt_match = re.search(r"\*\*Agent Prompt\*\*:\n```\n(.*?)\n```", feature_section, re.DOTALL)
-    agent_prompt = prompt_match.group(1) if prompt_match else None
+    agent_prompt = _find_section(feature_section, _PROMPT_HEADER, _PROMPT_END)
 
-    # Extract description (everything between header and Files)
-    desc_match = re.search(rf"#### Feature {escaped_id}: .*?\n(.*?)\n\*\*Time\*\*:", feature_section, re.DOTALL)
-    description = desc_match.group(1).strip() if desc_match else ""
+    # Extract description (everything between the header line and Time) -
+    # the section starts at its header, so no ID-specific pattern is needed
+    desc_start = feature_section.find('\n') + 1
+    desc_end = feature_section.find('\n**Time**:', desc_start)
+    description = feature_section[desc_start:desc_end].strip() if desc_end >= 0 else ""
 
     return {
         'id': feature_id,
@@ -133,68 +229,55 @@ def extract_implementation_feature(feature_id):
         'files': files,
         'description': description,
         'agent_prompt': agent_prompt,
-        'general_principles': extract_general_principles(IMPLEMENTATION_PLAN),
-        'project_structure': extract_project_structure(IMPLEMENTATION_PLAN),
+        'general_principles': general_principles,
+        'project_structure': project_structure,
         'plan_type': IMPLEMENTATION_PLAN
     }
 
 
-def extract_enhancement(enhancement_id):
+def extract_enhancement(enhancement_id, include_context=True):
     """
     Extract enhancement section from ENHANCEMENTS-PLAN.md.
     Pattern: ### X.Y Title
     """
     plan = read_plan(ENHANCEMENTS_PLAN)
 
-    # Escape dots in regex
-    escaped_id = enhancement_id.replace('.', r'\.')
-
-    # Pattern to match enhancement header (### X.Y Title)
-    enhancement_pattern = rf"### {escaped_id} (.*?)\n"
-    match = re.search(enhancement_pattern, plan)
+    # Look up the enhancement's span (up to the next enhancement or next priority section)
+    section = _section_index(ENHANCEMENTS_PLAN).get(enhancement_id)
 
-    if not match:
+    if not section:
         return None
 
-    enhancement_title = match.group(1)
-    start_pos = match.start()
-
-    # Find the end of this enhancement (next enhancement or next priority section)
-    next_pattern = r"### \d+\.\d+|## Priority \d+:|## Implementation Order|## Technical Notes"
-    next_match = re.search(next_pattern, plan[start_pos + 10:])
-
-    if next_match:
-        end_pos = start_pos + 10 + next_match.start()
-    else:
-        end_pos = len(plan)
-
+    start_pos, end_pos, enhancement_title = section
+    general_principles, project_structure = (
+        _context_sections(ENHANCEMENTS_PLAN) if include_context else (None, None)
+    )
     enhancement_section = plan[start_pos:end_pos]
 
     # Extract Goal
-    goal_match = re.search(r"\*\*Goal\*\*: (.*?)\n", enhancement_section)
-    goal = goal_match.group(1) if goal_match else ""
+    goal = _line_field(enhancement_section, _GOAL_MARKER) or ""
 
     # Extract Files
-    files_section = re.search(r"\*\*Files\*\*:\n((?:- .*?\n)+)", enhancement_section)
+    files_section = _ENHANCEMENT_FILES_RE.search(enhancement_section)
     files = []
     if files_section:
         files_text = files_section.group(1)
-        files = [f.strip('- `').strip('`').strip() for f in files_text.split('\n') if f.strip()]
+        files = _parse_file_lines(files_text)
 
     # Extract Implementation section
-    impl_match = re.search(r"\*\*Implementation\*\*:\n((?:- .*?\n)+)", enhancement_section)
+    impl_match = _IMPLEMENTATION_RE.search(enhancement_section)
     implementation = ""
     if impl_match:
         implementation = impl_match.group(1).strip()
 
     # Extract Investigation section (for bugs)
-    invest_match = re.search(r"\*\*Investigation(?:\sneeded)?\*\*:?\n((?:- .*?\n)+)", enhancement_section)
+    invest_match = _INVESTIGATION_RE.search(enhancement_section)
     investigation = ""
     if invest_match:
         investigation = invest_match.group(1).strip()
 
     # Extract Content outline (for lessons)
-    content_match = re.search(r"\*\*Content outline\*\*:\n((?:\d+\. .*?\n)+)", enhancement_section)
+    content_match = _CONTENT_OUTLINE_RE.search(enhancement_section)
     content_outline = ""
     if content_match:
         content_outline = content_match.group(1).strip()
@@ -243,35 +326,48 @@ When complete:
         'files': files,
         'description': description,
         'agent_prompt': agent_prompt,
-        'general_principles': extract_general_principles(ENHANCEMENTS_PLAN),
-        'project_structure': extract_project_structure(ENHANCEMENTS_PLAN),
+        'general_principles': general_principles,
+        'project_structure': project_structure,
         'plan_type': ENHANCEMENTS_PLAN
     }
 
 
-def extract_feature(feature_id, plan_type=IMPLEMENTATION_PLAN):
-    """Extract feature from appropriate plan file"""
+def extract_feature(feature_id, plan_type=IMPLEMENTATION_PLAN, include_context=True):
+    """
+    Extract feature from appropriate plan file
+
+    include_context=False skips the general principles / project structure
+    sections (left as None) for callers that don't display them.
+    """
     if plan_type == ENHANCEMENTS_PLAN:
-        return extract_enhancement(feature_id)
+        return extract_enhancement(feature_id, include_context)
     else:
-        return extract_implementation_feature(feature_id)
+        return extract_implementation_feature(feature_id, include_context)
 
 
 def list_implementation_features():
     """List all features from IMPLEMENTATION_PLAN.md"""
     plan = read_plan(IMPLEMENTATION_PLAN)
 
-    # Find all features
-    pattern = r"#### Feature ([\d\.]+): (.*?)\n\*\*Time\*\*: (.*?)\n"
-    matches = re.findall(pattern, plan)
+    # Find all features (from the section index) with a Time line right under the header
+    matches = []
+    for feature_id, (start_pos, end_pos, title) in _section_index(IMPLEMENTATION_PLAN).items():
+        line_start = plan.find('\n', start_pos) + 1
+        if plan.startswith(_TIME_MARKER, line_start):
+            time = _line_field(plan, _TIME_MARKER, line_start)
+            if time is not None:
+                matches.append((feature_id, title, time))
 
     if not matches:
         print("No features found in IMPLEMENTATION_PLAN.md")
         return
 
-    print("\n" + "=" * 80)
-    print("IMPLEMENTATION PLAN FEATURES")
-    print("=" * 80 + "\n")
+    # Collect the listing and write it in one go rather than print() per line
+    lines = []
+
+    lines.append("\n" + "=" * 80)
+    lines.append("IMPLEMENTATION PLAN FEATURES")
+    lines.append("=" * 80 + "\n")
 
     current_phase = None
 
@@ -282,43 +378,48 @@ def list_implementation_features():
         if phase != current_phase:
             current_phase = phase
             if current_phase == "0":
-                print("PHASE 0: Project Scaffolding")
+                lines.append("PHASE 0: Project Scaffolding")
             elif current_phase == "1":
-                print("\nPHASE 1: Core Python MVC + SQLite")
+                lines.append("\nPHASE 1: Core Python MVC + SQLite")
             elif current_phase == "2":
-                print("\nPHASE 2: Method Logging & Developer Panel")
+                lines.append("\nPHASE 2: Method Logging & Developer Panel")
             elif current_phase == "3":
-                print("\nPHASE 3: Lesson Engine")
+                lines.append("\nPHASE 3: Lesson Engine")
             elif current_phase == "4":
-                print("\nPHASE 4: Mode Toggle & Polish")
+                lines.append("\nPHASE 4: Mode Toggle & Polish")
             elif current_phase == "5":
-                print("\nPHASE 5: Deployment & Documentation")
-            print("-" * 80)
+                lines.append("\nPHASE 5: Deployment & Documentation")
+            lines.append("-" * 80)
 
-        print(f"  {feature_id:>4}  {title:<50}  ({time})")
+        lines.append(f"  {feature_id:>4}  {title:<50}  ({time})")
 
-    print("\n" + "=" * 80)
-    print(f"Total: {len(matches)} features")
-    print("=" * 80 + "\n")
-    print("Usage: python copy_feature.py <feature_id>")
-    print("Example: python copy_feature.py 1.5\n")
+    lines.append("\n" + "=" * 80)
+    lines.append(f"Total: {len(matches)} features")
+    lines.append("=" * 80 + "\n")
+    lines.append("Usage: python copy_feature.py <feature_id>")
+    lines.append("Example: python copy_feature.py 1.5\n")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def list_enhancements():
     """List all enhancements from ENHANCEMENTS-PLAN.md"""
-    plan = read_plan(ENHANCEMENTS_PLAN)
-
-    # Find all enhancements (### X.Y Title pattern)
-    pattern = r"### (\d+\.\d+) (.*?)\n"
-    matches = re.findall(pattern, plan)
+    # Find all enhancements (### X.Y Title pattern) - already indexed
+    matches = [
+        (enhancement_id, title)
+        for enhancement_id, (start_pos, end_pos, title) in _section_index(ENHANCEMENTS_PLAN).items()
+    ]
 
     if not matches:
         print("No enhancements found in ENHANCEMENTS-PLAN.md")
         return
 
-    print("\n" + "=" * 80)
-    print("ENHANCEMENTS PLAN")
-    print("=" * 80 + "\n")
+    # Collect the listing and write it in one go rather than print() per line
+    lines = []
+
+    lines.append("\n" + "=" * 80)
+    lines.append("ENHANCEMENTS PLAN")
+    lines.append("=" * 80 + "\n")
 
     current_priority = None
 
@@ -335,16 +436,18 @@ def list_enhancements():
                 "4": "Priority 4: Bug Fixes",
                 "5": "Priority 5: Lesson Content Updates"
             }
-            print(f"\n{priority_names.get(priority, f'Priority {priority}')}")
-            print("-" * 80)
+            lines.append(f"\n{priority_names.get(priority, f'Priority {priority}')}")
+            lines.append("-" * 80)
+
+        lines.append(f"  {enhancement_id:>4}  {title:<60}")
 
-        print(f"  {enhancement_id:>4}  {title:<60}")
+    lines.append("\n" + "=" * 80)
+    lines.append(f"Total: {len(matches)} enhancements")
+    lines.append("=" * 80 + "\n")
+    lines.append("Usage: python copy_feature.py -e <enhancement_id>")
+    lines.append("Example: python copy_feature.py -e 1.1\n")
 
-    print("\n" + "=" * 80)
-    print(f"Total: {len(matches)} enhancements")
-    print("=" * 80 + "\n")
-    print("Usage: python copy_feature.py -e <enhancement_id>")
-    print("Example: python copy_feature.py -e 1.1\n")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def list_features(plan_type=IMPLEMENTATION_PLAN):
@@ -355,106 +458,121 @@ def list_features(plan_type=IMPLEMENTATION_PLAN):
         list_implementation_features()
 
 
-def format_output(feature):
-    """Format feature for display and copying"""
-    output = []
-
+def _output_lines(feature):
+    """Yield the lines of a feature's display/copy text (without newlines)"""
     plan_name = "ENHANCEMENTS PLAN" if feature['plan_type'] == ENHANCEMENTS_PLAN else "IMPLEMENTATION PLAN"
 
     # Include General Principles and Project Structure at the top
-    output.append("\n" + "=" * 80)
-    output.append(f"AGENT GUIDELINES & PROJECT CONTEXT ({plan_name})")
-    output.append("=" * 80)
-    output.append("Read these sections carefully - they apply to all features.\n")
+    yield "\n" + "=" * 80
+    yield f"AGENT GUIDELINES & PROJECT CONTEXT ({plan_name})"
+    yield "=" * 80
+    yield "Read these sections carefully - they apply to all features.\n"
 
     if feature['general_principles']:
-        output.append("## GENERAL PRINCIPLES\n")
-        output.append(feature['general_principles'])
-        output.append("\n")
+        yield "## GENERAL PRINCIPLES\n"
+        yield feature['general_principles']
+        yield "\n"
 
     if feature['project_structure']:
-        output.append("## PROJECT STRUCTURE\n")
-        output.append(feature['project_structure'])
-        output.append("\n")
+        yield "## PROJECT STRUCTURE\n"
+        yield feature['project_structure']
+        yield "\n"
 
     # Now the specific feature
     feature_type = "ENHANCEMENT" if feature['plan_type'] == ENHANCEMENTS_PLAN else "FEATURE"
-    output.append("=" * 80)
-    output.append(f"{feature_type} {feature['id']}: {feature['title']}")
-    output.append("=" * 80 + "\n")
+    yield "=" * 80
+    yield f"{feature_type} {feature['id']}: {feature['title']}"
+    yield "=" * 80 + "\n"
 
     if feature['description']:
-        output.append("DESCRIPTION:")
-        output.append(feature['description'] + "\n")
+        yield "DESCRIPTION:"
+        yield feature['description'] + "\n"
 
-    output.append(f"TIME: {feature['time']}")
+    yield f"TIME: {feature['time']}"
 
     if feature['files']:
-        output.append("\nFILES TO CREATE/MODIFY:")
+        yield "\nFILES TO CREATE/MODIFY:"
         for f in feature['files']:
-            output.append(f"  - {f}")
+            yield f"  - {f}"
 
-    output.append("\n" + "-" * 80)
-    output.append("AGENT PROMPT (Copy from here):")
-    output.append("-" * 80 + "\n")
+    yield "\n" + "-" * 80
+    yield "AGENT PROMPT (Copy from here):"
+    yield "-" * 80 + "\n"
 
     if feature['agent_prompt']:
-        output.append(feature['agent_prompt'])
+        yield feature['agent_prompt']
     else:
-        output.append("[ERROR: Agent prompt not found]")
+        yield "[ERROR: Agent prompt not found]"
+
+    yield "\n" + "=" * 80 + "\n"
+
 
-    output.append("\n" + "=" * 80 + "\n")
+def format_output(feature):
+    """Format feature for display and copying"""
+    return "\n".join(_output_lines(feature))
 
-    return "\n".join(output)
 
+def write_output(feature, out):
+    """
+    Write format_output(feature) to a text stream, line by line.
 
-def save_to_file(feature, filename=None):
-    """Save feature to file"""
+    Same text as format_output(), streamed without building the whole string.
+    """
+    for i, line in enumerate(_output_lines(feature)):
+        if i:
+            out.write("\n")
+        out.write(line)
+
+
+def get_save_path(feature_id, plan_type=IMPLEMENTATION_PLAN, filename=None):
+    """Get the output/ path a feature is saved to"""
     if not filename:
-        prefix = "enhancement" if feature['plan_type'] == ENHANCEMENTS_PLAN else "feature"
-        filename = f"{prefix}_{feature['id'].replace('.', '_')}.txt"
+        prefix = "enhancement" if plan_type == ENHANCEMENTS_PLAN else "feature"
+        filename = f"{prefix}_{feature_id.replace('.', '_')}.txt"
 
-    output_dir = Path(__file__).parent / "output"
-    output_dir.mkdir(exist_ok=True)
+    return Path(__file__).parent / "output" / filename
 
-    filepath = output_dir / filename
 
-    with open(filepath, 'w') as f:
-        f.write(format_output(feature))
+def is_saved_output_fresh(filepath, plan_type=IMPLEMENTATION_PLAN):
+    """
+    Is a saved feature file newer than both its plan and this script?
 
-    return filepath
+    If so it's exactly what a new extraction would produce, and --save
+    can reuse it instead of parsing the plan again.
+    """
+    if not filepath.exists():
+        return False
 
+    sources = (get_plan_file(plan_type), Path(__file__))
+    return filepath.stat().st_mtime_ns > max(source.stat().st_mtime_ns for source in sources)
 
-def parse_args():
-    """Parse command line arguments"""
-    args = sys.argv[1:]
 
-    plan_type = IMPLEMENTATION_PLAN
-    feature_id = None
-    save_flag = False
-    list_flag = False
+def save_to_file(feature, filename=None):
+    """Save feature to file"""
+    filepath = get_save_path(feature['id'], feature['plan_type'], filename)
+    filepath.parent.mkdir(exist_ok=True)
+
+    with open(filepath, 'w') as f:
+        write_output(feature, f)
 
-    i = 0
-    while i < len(args):
-        arg = args[i]
+    return filepath
 
-        if arg in ['-e', '--enhancements']:
-            plan_type = ENHANCEMENTS_PLAN
-        elif arg == '--save':
-            save_flag = True
-        elif arg == '--list':
-            list_flag = True
-        elif not arg.startswith('-'):
-            feature_id = arg
 
-        i += 1
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Extract a feature/enhancement and its agent prompt from a plan file."
+    )
+    parser.add_argument('feature_id', nargs='?', help="Feature/enhancement ID, e.g. 1.5")
+    parser.add_argument(
+        '-e', '--enhancements', dest='plan_type', action='store_const',
+        const=ENHANCEMENTS_PLAN, default=IMPLEMENTATION_PLAN,
+        help="Use ENHANCEMENTS-PLAN.md instead of IMPLEMENTATION_PLAN.md"
+    )
+    parser.add_argument('--save', dest='save_flag', action='store_true', help="Save output to file")
+    parser.add_argument('--list', dest='list_flag', action='store_true', help="List all features/enhancements")
 
-    return {
-        'plan_type': plan_type,
-        'feature_id': feature_id,
-        'save_flag': save_flag,
-        'list_flag': list_flag
-    }
+    return vars(parser.parse_args())
 
 
 def main():
@@ -484,6 +602,14 @@ def main():
         print("Use --list to see available features/enhancements", file=sys.stderr)
         sys.exit(1)
 
+    # Reuse a saved copy that's newer than the plan (and this script)
+    if args['save_flag']:
+        filepath = get_save_path(args['feature_id'], args['plan_type'])
+        if is_saved_output_fresh(filepath, args['plan_type']):
+            sys.stdout.write(filepath.read_text())
+            print(f"\n✓ Up to date: {filepath}", file=sys.stderr)
+            sys.exit(0)
+
     # Extract feature
     feature = extract_feature(args['feature_id'], args['plan_type'])
 
@@ -498,8 +624,7 @@ def main():
         sys.exit(1)
 
     # Display output (clean, no extra messages for piping to clipboard)
-    output = format_output(feature)
-    print(output, end='')
+    write_output(feature, sys.stdout)
 
     # Save to file if requested (separate from stdout)
     if args['save_flag']: